@@ -20,6 +20,7 @@ CONFIG_DIR = SRC_DIR / "config"
 SETTINGS_FILE = CONFIG_DIR / "user_settings.json"
 
 HISTORY_FILE = APP_DATA_DIR / "scan_history.json"
+SCAN_CACHE_DB = APP_DATA_DIR / "scans.db"
 SETTINGS_BACKUP = APP_DATA_DIR / "settings_backup.json"
 EXPORT_DIR = APP_DATA_DIR / "exports"
 
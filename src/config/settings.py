@@ -25,7 +25,7 @@ DEFAULT_MASTER_LIST_SHEET_NAME = "MasterList"
 CREDENTIALS_FILE = "credentials.json"
 TOKEN_FILE = "token.pickle"
 
-SUPPORTED_IMAGE_TYPES = [("JSON files", "*.json"), ("All files", "*.*")]
+CREDENTIALS_FILETYPES = (("JSON files", "*.json"), ("All files", "*.*"))
 SUPPORTED_EXPORT_TYPES = [
     ("CSV files", "*.csv"),
     ("Text files", "*.txt"),
@@ -39,6 +39,10 @@ NOTIFICATION_SIZE = "300x150"
 # Auto-save settings
 AUTO_SAVE_INTERVAL = 300  # 5 minutes instead of 30 seconds
 MAX_HISTORY_ITEMS = 1000
+MAX_HISTORY_RECORDS = 10000  # scans kept in the history tab model
+HISTORY_PAGE_SIZE = 500  # older rows rendered when the history is scrolled to the bottom
+LOG_PAGE_SIZE = 500  # log rows rendered at a time in the logs tab
+LOG_MMAP_THRESHOLD = 4 * 1024 * 1024  # log files at least this large are memory-mapped when read
 
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -47,6 +51,12 @@ LOG_FILE = "qr_scanner.log"
 THREAD_POOL_SIZE = 4
 MAX_CONCURRENT_SCANS = 2
 CACHE_SIZE = 100
+LOOKUP_CACHE_SIZE = 4096  # volunteer lookups memoized by the main window
+DEBUG_INFO_CACHE_TTL = 5.0  # seconds
+
+# Google Sheets scan batching
+SHEETS_BATCH_SIZE = 25  # flush immediately once this many scans are pending
+SHEETS_FLUSH_DELAY_MS = 2000  # otherwise flush this long after the first pending scan
 
 ENCRYPT_CREDENTIALS = True
 SESSION_TIMEOUT = 3600 
\ No newline at end of file
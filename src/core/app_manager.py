@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import messagebox
 import sys
 import threading
+import time
 from typing import Optional, Callable, Any, Dict
 from pathlib import Path
 
@@ -70,6 +71,17 @@ class QRScannerApp(LoggerMixin):
         self.gui_callback: Optional[Callable] = None
         self.status_callback: Optional[Callable] = None
         
+        # Newest camera frame awaiting the GUI; at most one delivery is posted at a time
+        self._latest_frame = None
+        self._frame_posted = False
+        self._frame_lock = threading.Lock()
+        
+        # Cached (timestamp, text) for debug_master_list_structure
+        self._debug_info_cache: Optional[tuple] = None
+        
+        # Bumped on every master list load so callers can invalidate lookup caches
+        self.master_list_version = 0
+        
         # Setup state transition rules
         self._setup_state_transitions()
         
@@ -170,7 +182,7 @@ class QRScannerApp(LoggerMixin):
         
         # Initialize Google Sheets manager
         self.sheets_manager = GoogleSheetsManager()
-        self.sheets_manager.set_status_callback(self.gui_callback)
+        self.sheets_manager.set_status_callback(self._sheets_status_callback)
         
         # Initialize camera manager with callbacks
         self.camera_manager = CameraManager(
@@ -414,8 +426,7 @@ class QRScannerApp(LoggerMixin):
         try:
             if self.scan_processor:
                 # Archive current history before shutdown
-                if hasattr(self.scan_processor, 'file_manager'):
-                    self.scan_processor.file_manager.archive_current_history()
+                self.scan_processor.file_manager.archive_current_history()
                 
                 # Save final history state
                 self.scan_processor.save_all_data()
@@ -433,13 +444,12 @@ class QRScannerApp(LoggerMixin):
             # Set running flag to False to stop any ongoing operations
             self.is_running = False
             
-            # Stop camera if running (non-blocking)
+            # Stop camera on a helper thread so its thread join overlaps with
+            # the history/sheets cleanup below instead of preceding it
+            camera_stopper = None
             if self.camera_manager:
-                try:
-                    self.camera_manager.stop_camera()
-                    self.log_info("Camera stopped")
-                except Exception as e:
-                    self.log_error(f"Error stopping camera: {e}")
+                camera_stopper = threading.Thread(target=self._stop_camera_for_shutdown, daemon=True)
+                camera_stopper.start()
             
             # Quick cleanup - don't block on these operations
             try:
@@ -458,6 +468,9 @@ class QRScannerApp(LoggerMixin):
             except Exception as e:
                 self.log_error(f"Error during cleanup: {e}")
             
+            if camera_stopper:
+                camera_stopper.join(timeout=1.0)
+            
             self.log_info("Application shutdown complete")
             
         except Exception as e:
@@ -466,14 +479,22 @@ class QRScannerApp(LoggerMixin):
             # Ensure we always set running to False
             self.is_running = False
     
-    def _camera_callback(self, data: str, barcode_type: str, photo=None):
+    def _stop_camera_for_shutdown(self):
+        """Stop the camera during shutdown, logging rather than raising errors."""
+        try:
+            self.camera_manager.stop_camera()
+            self.log_info("Camera stopped")
+        except Exception as e:
+            self.log_error(f"Error stopping camera: {e}")
+    
+    def _camera_callback(self, data: str, barcode_type: str, frame=None):
         """
         Callback for camera events.
         
         Args:
             data: Scanned data
             barcode_type: Type of barcode
-            photo: Optional photo data
+            frame: Optional PIL image for the video preview
         """
         try:
             # Process scan data
@@ -489,13 +510,44 @@ class QRScannerApp(LoggerMixin):
                     self.root.after(0, self.gui_callback, 'scan', {'content': data, 'type': barcode_type})
             
             # Update video frame
-            elif photo:
+            elif frame is not None:
                 if self.root and self.gui_callback:
-                    self.root.after(0, self.gui_callback, 'video_frame', photo)
+                    # Replace any undelivered frame rather than queueing behind it
+                    with self._frame_lock:
+                        self._latest_frame = frame
+                        post = not self._frame_posted
+                        self._frame_posted = True
+                    if post:
+                        self.root.after(0, self._deliver_video_frame)
                     
         except Exception as e:
             self.log_error(f"Error in camera callback: {str(e)}", exc_info=True)
     
+    def _deliver_video_frame(self):
+        """Hand the newest camera frame to the GUI (runs on the Tk thread)."""
+        with self._frame_lock:
+            frame = self._latest_frame
+            self._latest_frame = None
+            self._frame_posted = False
+        if frame is not None and self.gui_callback:
+            self.gui_callback('video_frame', frame)
+    
+    def _sheets_status_callback(self, status_type: str, data: dict):
+        """
+        Forward sheets manager status events to the GUI thread.
+        
+        Args:
+            status_type: Type of status event
+            data: Status payload
+        """
+        if self.root and self.gui_callback:
+            self.root.after(0, self.gui_callback, status_type, data)
+    
+    def _post_status(self, message: str):
+        """Send a status message to the GUI thread; safe to call from worker threads."""
+        if self.root and self.status_callback:
+            self.root.after(0, self.status_callback, message)
+    
     def _camera_error_callback(self, error: str):
         """
         Callback for camera errors.
@@ -612,13 +664,11 @@ class QRScannerApp(LoggerMixin):
             
             spreadsheet_title = self.sheets_manager.connect_to_spreadsheet(spreadsheet_id, sheet_name)
             self.log_info(f"Connected to spreadsheet: {spreadsheet_title}")
-            if self.status_callback:
-                self.status_callback(f"Connected to: {spreadsheet_title}")
+            self._post_status(f"Connected to: {spreadsheet_title}")
             return spreadsheet_title
         except Exception as e:
             self.log_error(f"Error connecting to spreadsheet: {str(e)}")
-            if self.status_callback:
-                self.status_callback(f"Connection error: {str(e)}")
+            self._post_status(f"Connection error: {str(e)}")
             # Send error status to GUI
             if self.gui_callback:
                 self.root.after(0, self.gui_callback, 'sheets_status', 
@@ -639,6 +689,8 @@ class QRScannerApp(LoggerMixin):
         """Load master list data from Google Sheets."""
         try:
             count = self.sheets_manager.load_master_list()
+            self._debug_info_cache = None
+            self.master_list_version += 1
             self.log_info(f"Loaded {count} records from master list")
             return count
         except Exception as e:
@@ -732,6 +784,22 @@ class QRScannerApp(LoggerMixin):
             self.log_error(f"Error adding scan data: {str(e)}")
             return False
     
+    def add_scan_batch(self, scans: list) -> Optional[int]:
+        """
+        Add several scans to Google Sheets in one request.
+        
+        Args:
+            scans: List of (data, barcode_type, scanned_at) tuples
+            
+        Returns:
+            Number of scans recorded, or None if the batch was not sent
+        """
+        try:
+            return self.sheets_manager.add_scan_batch(scans)
+        except Exception as e:
+            self.log_error(f"Error adding scan batch: {str(e)}")
+            return None
+    
     def lookup_volunteer(self, volunteer_id: str) -> Optional[dict]:
         """Look up volunteer information by ID."""
         try:
@@ -742,6 +810,12 @@ class QRScannerApp(LoggerMixin):
             self.log_error(f"Error looking up volunteer: {str(e)}")
             return None
     
+    def get_master_index(self) -> Dict[str, dict]:
+        """Get the master list index keyed by lower-cased, stripped volunteer ID."""
+        if self.sheets_manager:
+            return self.sheets_manager.get_master_index()
+        return {}
+    
     def get_master_list_data(self) -> list:
         """Get the loaded master list data."""
         try:
@@ -753,26 +827,35 @@ class QRScannerApp(LoggerMixin):
             return []
     
     def debug_master_list_structure(self) -> str:
-        """Debug the master list structure and return a formatted string."""
+        """
+        Debug the master list structure and return a formatted string.
+        
+        The text is built lazily and reused for DEBUG_INFO_CACHE_TTL seconds
+        so repeated requests do not walk the master list again.
+        """
         try:
             if not self.sheets_manager:
                 return "Sheets manager not available"
             
+            now = time.monotonic()
+            if self._debug_info_cache and now - self._debug_info_cache[0] < DEBUG_INFO_CACHE_TTL:
+                return self._debug_info_cache[1]
+            
             data = self.sheets_manager.get_master_list_data()
             if not data:
                 return "No master list data loaded"
             
-            result = f"Master list has {len(data)} records\n"
+            lines = [f"Master list has {len(data)} records"]
             
             # Get headers if available
-            if hasattr(self.sheets_manager, 'master_list_headers') and self.sheets_manager.master_list_headers:
-                result += f"Headers: {self.sheets_manager.master_list_headers}\n"
-            
-            result += f"First 3 rows:\n"
+            if self.sheets_manager.master_list_headers:
+                lines.append(f"Headers: {self.sheets_manager.master_list_headers}")
             
-            for i, row in enumerate(data[:3]):
-                result += f"Row {i+1}: {row}\n"
+            lines.append("First 3 rows:")
+            lines.extend(f"Row {i+1}: {row}" for i, row in enumerate(data[:3]))
             
+            result = "\n".join(lines) + "\n"
+            self._debug_info_cache = (now, result)
             return result
         except Exception as e:
             return f"Error debugging master list: {str(e)}"
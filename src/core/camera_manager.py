@@ -3,12 +3,16 @@ import numpy as np
 from pyzbar import pyzbar
 import threading
 import time
-from PIL import Image, ImageTk
+from PIL import Image
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Size of the preview frames passed to the GUI
+DISPLAY_WIDTH = 640
+DISPLAY_HEIGHT = 480
+
 
 class CameraManager:
     def __init__(self, scan_callback=None):
@@ -84,17 +88,16 @@ class CameraManager:
                 if self._stop_event.is_set():
                     break
                 
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(frame_rgb)
-                
-                display_width = 640
-                display_height = 480
-                pil_image = pil_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-                
-                photo = ImageTk.PhotoImage(pil_image)
+                # Scale the preview in OpenCV before colour conversion, so only
+                # display-sized pixels are converted and handed to PIL
+                preview = frame
+                if frame.shape[1] != DISPLAY_WIDTH or frame.shape[0] != DISPLAY_HEIGHT:
+                    preview = cv2.resize(frame, (DISPLAY_WIDTH, DISPLAY_HEIGHT), interpolation=cv2.INTER_AREA)
+                pil_image = Image.fromarray(cv2.cvtColor(preview, cv2.COLOR_BGR2RGB))
                 
+                # The GUI converts the PIL image on its own thread, reusing one PhotoImage
                 if self.scan_callback and not self._stop_event.is_set():
-                    self.scan_callback(None, None, photo)
+                    self.scan_callback(None, None, pil_image)
                 
                 barcodes = pyzbar.decode(frame)
                 
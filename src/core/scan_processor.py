@@ -153,7 +153,7 @@ class ScanProcessor(LoggerMixin):
         current_time = time.time()
         if current_time - self.last_save_time >= AUTO_SAVE_INTERVAL:
             # Only save if there are actual changes
-            if hasattr(self, '_last_save_count') and self._last_save_count == len(self.scan_history):
+            if self._last_save_count == len(self.scan_history):
                 return  # No changes, skip save
             
             self.save_all_data()
@@ -163,7 +163,7 @@ class ScanProcessor(LoggerMixin):
     def save_all_data(self) -> bool:
         try:
             # Only save if there are actual changes
-            if hasattr(self, '_last_save_count') and self._last_save_count == len(self.scan_history):
+            if self._last_save_count == len(self.scan_history):
                 return True  # No changes, skip save
             
             history_data = list(self.scan_history)
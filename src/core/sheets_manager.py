@@ -3,8 +3,10 @@ Google Sheets integration for QR Scanner.
 """
 
 import os
+import logging
 import pickle
 import json
+import threading
 from datetime import datetime
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -25,6 +27,8 @@ class GoogleSheetsManager:
     
     def __init__(self):
         self.sheets_service = None
+        # The API client shares one HTTP connection, so requests are made one at a time
+        self._io_lock = threading.RLock()
         # Initialize with default values
         self.spreadsheet_id = None
         self.sheet_name = None
@@ -32,6 +36,8 @@ class GoogleSheetsManager:
         self.master_list_spreadsheet_id = None
         self.master_list_sheet_name = DEFAULT_MASTER_LIST_SHEET_NAME
         self.master_list_data = []
+        self.master_list_headers = []
+        self._master_index = {}
         self.credentials_file = None
         self.token_file = None
         self.status_callback = None
@@ -129,42 +135,43 @@ class GoogleSheetsManager:
     
     def connect_to_spreadsheet(self, spreadsheet_id, sheet_name):
         """Connect to a specific Google Spreadsheet."""
-        try:
-            creds = self._get_credentials()
-            if not creds:
-                raise Exception("No valid credentials available")
-            
-            # Build the service
-            self.sheets_service = build('sheets', 'v4', credentials=creds)
-            self.spreadsheet_id = spreadsheet_id
-            self.sheet_name = sheet_name
-            
-            # Test the connection by getting spreadsheet info
-            spreadsheet = self.sheets_service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
-            
-            spreadsheet_title = spreadsheet.get('properties', {}).get('title', 'Unknown')
-            logger.info(f"Connected to spreadsheet: {spreadsheet_title}")
-            
-            # Create sheets if they don't exist
-            self._create_sheet_if_needed()
-            
-            # Ensure headers are set up
-            self._ensure_scan_sheet_headers()
-            
-            # Send status update
-            if self.status_callback:
-                self.status_callback('sheets_status', {
-                    'status': 'success',
-                    'text': f'Connected to {spreadsheet_title}'
-                })
-            
-            return spreadsheet_title
-            
-        except Exception as e:
-            logger.error(f"Error connecting to spreadsheet: {str(e)}")
-            raise
+        with self._io_lock:
+            try:
+                creds = self._get_credentials()
+                if not creds:
+                    raise Exception("No valid credentials available")
+                
+                # Build the service
+                self.sheets_service = build('sheets', 'v4', credentials=creds)
+                self.spreadsheet_id = spreadsheet_id
+                self.sheet_name = sheet_name
+                
+                # Test the connection by getting spreadsheet info
+                spreadsheet = self.sheets_service.spreadsheets().get(
+                    spreadsheetId=spreadsheet_id
+                ).execute()
+                
+                spreadsheet_title = spreadsheet.get('properties', {}).get('title', 'Unknown')
+                logger.info(f"Connected to spreadsheet: {spreadsheet_title}")
+                
+                # Create sheets if they don't exist
+                self._create_sheet_if_needed()
+                
+                # Ensure headers are set up
+                self._ensure_scan_sheet_headers()
+                
+                # Send status update
+                if self.status_callback:
+                    self.status_callback('sheets_status', {
+                        'status': 'success',
+                        'text': f'Connected to {spreadsheet_title}'
+                    })
+                
+                return spreadsheet_title
+                
+            except Exception as e:
+                logger.error(f"Error connecting to spreadsheet: {str(e)}")
+                raise
     
     def _create_sheet_if_needed(self):
         """Create sheets if they don't exist."""
@@ -255,106 +262,116 @@ class GoogleSheetsManager:
     
     def add_scan_data(self, data, barcode_type):
         """Add or update scan data in the Google Sheet."""
-        if not self.is_connected():
-            logger.warning("Not connected to Google Sheets")
-            return False
+        return self.add_scan_batch([(data, barcode_type, datetime.now())]) == 1
+    
+    def add_scan_batch(self, scans):
+        """
+        Add several scans to the Google Sheet with a single append request.
         
-        try:
-            # Get current date and time
-            now = datetime.now()
-            date_str = now.strftime("%Y-%m-%d")
-            time_str = now.strftime("%I:%M:%S %p")  # 12-hour format with AM/PM
-            
-            # Look up volunteer information from master list
-            volunteer_info = self.lookup_volunteer_by_id(data)
-            
-            if volunteer_info:
-                # Use names from master list
-                first_name = volunteer_info['first_name']
-                last_name = volunteer_info['last_name']
-                logger.info(f"Found volunteer in master list: {first_name} {last_name}")
-                # Format name as "last name, first name"
-                formatted_name = f"{last_name}, {first_name}" if last_name and first_name else f"{first_name}{last_name}"
-                
-                # Set status for found users
-                status = "Present"
-                
-                # Prepare the data: [ID Number, Date, Time In, Status]
-                values = [[data, date_str, time_str, status]]
-                
-                # First, try to find an existing row with the same ID
-                existing_row = self._find_row_by_id(data)
+        Args:
+            scans: Iterable of (data, barcode_type, scanned_at) tuples
+            
+        Returns:
+            Number of scans recorded, counting IDs that already had a row,
+            or None if the batch could not be sent and should be retried
+        """
+        with self._io_lock:
+            if not self.is_connected():
+                logger.warning("Not connected to Google Sheets")
+                return None
+            
+            if not self.master_list_data:
+                logger.warning("Master list not loaded")
+                return None
+            
+            try:
+                existing_ids = self._get_existing_scan_ids()
+                values = []
+                recorded = 0
                 
-                if existing_row is not None:
-                    # TEMPORARILY DISABLED: Skip updating existing rows to test
-                    logger.info(f"Found existing row for ID: {data} - skipping update to preserve formulas")
-                    return True
-                else:
-                    # Append new row if no existing row found
-                    body = {'values': values}
+                for data, barcode_type, scanned_at in scans:
+                    # Only volunteers in the master list are added to sheets
+                    volunteer_info = self.lookup_volunteer_by_id(data)
+                    if not volunteer_info:
+                        logger.warning(f"Volunteer ID '{data}' not found in master list - not adding to sheets")
+                        continue
                     
-                    result = self.sheets_service.spreadsheets().values().append(
+                    recorded += 1
+                    volunteer_id = str(data).strip()
+                    if volunteer_id in existing_ids:
+                        # TEMPORARILY DISABLED: Skip updating existing rows to test
+                        logger.info(f"Found existing row for ID: {data} - skipping update to preserve formulas")
+                        continue
+                    existing_ids.add(volunteer_id)
+                    
+                    # Prepare the data: [ID Number, Date, Time In (12-hour), Status]
+                    values.append([
+                        data,
+                        scanned_at.strftime("%Y-%m-%d"),
+                        scanned_at.strftime("%I:%M:%S %p"),
+                        "Present"
+                    ])
+                
+                if values:
+                    self.sheets_service.spreadsheets().values().append(
                         spreadsheetId=self.spreadsheet_id,
                         range=f"{self.sheet_name}!A:D",
                         valueInputOption='USER_ENTERED',
-                        body=body
+                        body={'values': values}
                     ).execute()
-                    
-                    logger.info(f"Added new row for ID: {data}")
+                    logger.info(f"Added {len(values)} new row(s) to {self.sheet_name}")
                 
-                return True
-            else:
-                # User not found in master list - do not add to sheets
-                logger.warning(f"Volunteer ID '{data}' not found in master list - not adding to sheets")
-                return False
-            
-        except Exception as e:
-            logger.error(f"Error adding/updating scan data: {str(e)}")
-            return False
+                return recorded
+                
+            except Exception as e:
+                logger.error(f"Error adding/updating scan data: {str(e)}")
+                return None
     
     def load_master_list(self):
         """Load master list data from Google Sheets."""
-        if not self.is_connected():
-            logger.warning("Not connected to Google Sheets")
-            return 0
-        
-        try:
-            # Use Master List specific spreadsheet ID if configured, otherwise use main spreadsheet
-            master_spreadsheet_id = getattr(self, 'master_list_spreadsheet_id', None) or self.spreadsheet_id
-            
-            # Ensure master list sheet exists in the target spreadsheet
-            self._ensure_master_list_sheet_exists(master_spreadsheet_id)
-            
-            # Get all data from MasterList sheet
-            result = self.sheets_service.spreadsheets().values().get(
-                spreadsheetId=master_spreadsheet_id,
-                range=f"{self.master_list_sheet}!A:Z"
-            ).execute()
-            
-            values = result.get('values', [])
-            
-            if not values:
-                logger.warning("No data found in MasterList sheet")
+        with self._io_lock:
+            if not self.is_connected():
+                logger.warning("Not connected to Google Sheets")
                 return 0
             
-            # Store headers and data
-            self.master_list_headers = values[0] if values else []
-            self.master_list_data = values[1:] if len(values) > 1 else []
-            
-            count = len(self.master_list_data)
-            logger.info(f"Loaded {count} records from master list (spreadsheet: {master_spreadsheet_id})")
-            
-            # Debug: Log the headers and first few rows to understand the structure
-            if count > 0:
-                logger.debug(f"Master list headers: {self.master_list_headers}")
-                for i, row in enumerate(self.master_list_data[:3]):  # Log first 3 rows
-                    logger.debug(f"Master list row {i+1}: {row}")
-            
-            return count
-            
-        except Exception as e:
-            logger.error(f"Error loading master list: {str(e)}")
-            return 0
+            try:
+                # Use Master List specific spreadsheet ID if configured, otherwise use main spreadsheet
+                master_spreadsheet_id = getattr(self, 'master_list_spreadsheet_id', None) or self.spreadsheet_id
+                
+                # Ensure master list sheet exists in the target spreadsheet
+                self._ensure_master_list_sheet_exists(master_spreadsheet_id)
+                
+                # Get all data from MasterList sheet
+                result = self.sheets_service.spreadsheets().values().get(
+                    spreadsheetId=master_spreadsheet_id,
+                    range=f"{self.master_list_sheet}!A:Z"
+                ).execute()
+                
+                values = result.get('values', [])
+                
+                if not values:
+                    logger.warning("No data found in MasterList sheet")
+                    return 0
+                
+                # Store headers and data
+                self.master_list_headers = values[0] if values else []
+                self.master_list_data = values[1:] if len(values) > 1 else []
+                self._build_master_index()
+                
+                count = len(self.master_list_data)
+                logger.info(f"Loaded {count} records from master list (spreadsheet: {master_spreadsheet_id})")
+                
+                # Debug: Log the headers and first few rows to understand the structure
+                if count > 0 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Master list headers: {self.master_list_headers}")
+                    for i, row in enumerate(self.master_list_data[:3]):  # Log first 3 rows
+                        logger.debug(f"Master list row {i+1}: {row}")
+                
+                return count
+                
+            except Exception as e:
+                logger.error(f"Error loading master list: {str(e)}")
+                return 0
     
     def _ensure_master_list_sheet_exists(self, spreadsheet_id):
         """Ensure the master list sheet exists in the specified spreadsheet."""
@@ -428,29 +445,20 @@ class GoogleSheetsManager:
         
         return None
     
-    def lookup_volunteer_by_id(self, volunteer_id):
+    def _resolve_master_list_columns(self):
         """
-        Look up volunteer information by volunteer ID.
+        Work out which master list columns hold the ID and name fields.
         
-        Args:
-            volunteer_id: The volunteer ID to search for
-            
         Returns:
-            Dictionary with volunteer information or None if not found
+            Tuple of (id, first name, last name, combined name) column indexes;
+            the combined name index is None when separate name columns are used
         """
-        if not self.master_list_data:
-            logger.warning("Master list not loaded")
-            return None
-        
-        volunteer_id = str(volunteer_id).strip()
-        
-        # Find the ID column index from headers
         id_column_index = 0  # Default to first column
         first_name_column_index = 1  # Default to second column
         last_name_column_index = 2   # Default to third column
         name_column_index = None     # For combined name column
         
-        if hasattr(self, 'master_list_headers') and self.master_list_headers:
+        if self.master_list_headers:
             headers = [str(h).lower().strip() for h in self.master_list_headers]
             logger.debug(f"Looking for columns in headers: {self.master_list_headers}")
             
@@ -474,79 +482,89 @@ class GoogleSheetsManager:
                     name_column_index = i
                     logger.debug(f"Found Name column at index {i}: '{self.master_list_headers[i]}'")
         
+        return id_column_index, first_name_column_index, last_name_column_index, name_column_index
+    
+    def _build_master_index(self):
+        """Index the loaded master list by normalized volunteer ID."""
+        id_column_index, first_name_column_index, last_name_column_index, name_column_index = \
+            self._resolve_master_list_columns()
+        
+        index = {}
         for row in self.master_list_data:
-            # Check if the volunteer ID matches (case-insensitive)
-            if row and len(row) > id_column_index and str(row[id_column_index]).strip().lower() == volunteer_id.lower():
-                logger.debug(f"Found matching row: {row}")
-                
-                # Extract names based on column structure
-                if name_column_index is not None and len(row) > name_column_index:
-                    # Single name column - check if it's "Last, First" format
-                    name_value = str(row[name_column_index]).strip()
-                    if ',' in name_value:
-                        name_parts = name_value.split(',')
-                        if len(name_parts) >= 2:
-                            last_name = name_parts[0].strip()
-                            first_name = name_parts[1].strip()
-                        else:
-                            first_name = name_value
-                            last_name = ''
-                    else:
-                        # Single name without comma - treat as first name
-                        first_name = name_value
-                        last_name = ''
+            if not row or len(row) <= id_column_index:
+                continue
+            
+            key = str(row[id_column_index]).strip().lower()
+            if key in index:
+                # Keep the first matching row, as the sequential search did
+                continue
+            
+            # Extract names based on column structure
+            if name_column_index is not None and len(row) > name_column_index:
+                # Single name column - check if it's "Last, First" format
+                name_value = str(row[name_column_index]).strip()
+                if ',' in name_value:
+                    name_parts = name_value.split(',')
+                    last_name = name_parts[0].strip()
+                    first_name = name_parts[1].strip()
                 else:
-                    # Separate first and last name columns
-                    first_name = str(row[first_name_column_index]).strip() if len(row) > first_name_column_index else ''
-                    last_name = str(row[last_name_column_index]).strip() if len(row) > last_name_column_index else ''
-                
-                volunteer_info = {
-                    'volunteer_id': row[id_column_index] if len(row) > id_column_index else '',
-                    'first_name': first_name,
-                    'last_name': last_name,
-                    'full_row': row
-                }
-                logger.info(f"Found volunteer: {volunteer_info['first_name']} {volunteer_info['last_name']} (ID: {volunteer_info['volunteer_id']})")
-                return volunteer_info
+                    # Single name without comma - treat as first name
+                    first_name = name_value
+                    last_name = ''
+            else:
+                # Separate first and last name columns
+                first_name = str(row[first_name_column_index]).strip() if len(row) > first_name_column_index else ''
+                last_name = str(row[last_name_column_index]).strip() if len(row) > last_name_column_index else ''
+            
+            index[key] = {
+                'volunteer_id': row[id_column_index],
+                'first_name': first_name,
+                'last_name': last_name,
+                'full_row': row
+            }
         
-        logger.warning(f"Volunteer ID '{volunteer_id}' not found in master list")
-        return None
+        self._master_index = index
+    
+    def get_master_index(self):
+        """Get the master list index keyed by lower-cased, stripped volunteer ID."""
+        return self._master_index
     
-    def _find_row_by_id(self, volunteer_id: str):
+    def lookup_volunteer_by_id(self, volunteer_id):
         """
-        Find the row number (0-based index) of an existing record with the given ID in the scan sheet.
+        Look up volunteer information by volunteer ID.
         
         Args:
             volunteer_id: The volunteer ID to search for
             
         Returns:
-            Row number (0-based) if found, None if not found
+            Dictionary with volunteer information or None if not found
         """
-        try:
-            if not self.is_connected():
-                return None
-            
-            # Get all data from the scan sheet
-            result = self.sheets_service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.sheet_name}!A:D"
-            ).execute()
-            
-            values = result.get('values', [])
-            
-            if not values:
-                return None
-            
-            # Skip header row, search in data rows
-            for i, row in enumerate(values[1:], start=1):  # start=1 to skip header
-                if len(row) > 0 and str(row[0]).strip() == str(volunteer_id).strip():
-                    return i  # Return 0-based row index
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error finding row by ID: {str(e)}")
+        if not self.master_list_data:
+            logger.warning("Master list not loaded")
             return None
+        
+        volunteer_info = self._master_index.get(str(volunteer_id).strip().lower())
+        if volunteer_info:
+            logger.info(f"Found volunteer: {volunteer_info['first_name']} {volunteer_info['last_name']} (ID: {volunteer_info['volunteer_id']})")
+            return volunteer_info
+        
+        logger.warning(f"Volunteer ID '{volunteer_id}' not found in master list")
+        return None
+    
+    def _get_existing_scan_ids(self):
+        """
+        Get the IDs that already have a row in the scan sheet.
+        
+        Returns:
+            Set of stripped ID strings, excluding the header row
+        """
+        result = self.sheets_service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id,
+            range=f"{self.sheet_name}!A:A"
+        ).execute()
+        
+        values = result.get('values', [])
+        return {str(row[0]).strip() for row in values[1:] if row}
     
     def get_master_list_data(self):
         """Get the loaded master list data."""
@@ -208,8 +208,9 @@ class StatusIndicator(tk.Frame):
                            highlightthickness=0)
         self.dot.pack(side=tk.LEFT, padx=(0, 8))
         
-        # Status text
-        self.label = tk.Label(self, text=text, font=SMALL_FONT, 
+        # Status text, bound to a StringVar so text changes skip configure()
+        self._text_var = tk.StringVar(self, value=text)
+        self.label = tk.Label(self, textvariable=self._text_var, font=SMALL_FONT, 
                              fg=THEME_COLORS['text_secondary'], bg=THEME_COLORS['background'])
         self.label.pack(side=tk.LEFT)
         
@@ -217,16 +218,37 @@ class StatusIndicator(tk.Frame):
         if tooltip:
             Tooltip(self, tooltip)
         
+        # Last applied state, used to skip redundant widget updates
+        self._last_status = None
+        self._last_text = text
+        
         self.set_status(status)
     
     def set_status(self, status):
         """Set the status and update colors with animation."""
+        if status == self._last_status:
+            return
+        self._last_status = status
         color = self.status_colors.get(status, self.status_colors['neutral'])
         
         # Animate status change
-        self._animate_status_change(color, status)
+        self._animate_status_change(color)
+        self.label.configure(fg=color)
     
-    def _animate_status_change(self, color, status):
+    def set_state(self, status, text):
+        """Set the status and text together."""
+        if status == self._last_status:
+            self.set_text(text)
+            return
+        self._last_status = status
+        self._last_text = text
+        color = self.status_colors.get(status, self.status_colors['neutral'])
+        
+        self._animate_status_change(color)
+        self.label.configure(fg=color)
+        self._text_var.set(text)
+    
+    def _animate_status_change(self, color):
         """Animate the status change for better visual feedback."""
         # Clear previous dot
         self.dot.delete("all")
@@ -244,20 +266,13 @@ class StatusIndicator(tk.Frame):
                 self.dot.create_oval(2, 2, 10, 10, fill=color, outline="")
         
         animate_dot()
-        
-        # Update text color
-        if status == 'success':
-            self.label.configure(fg=THEME_COLORS['success'])
-        elif status == 'warning':
-            self.label.configure(fg=THEME_COLORS['warning'])
-        elif status == 'error':
-            self.label.configure(fg=THEME_COLORS['error'])
-        else:
-            self.label.configure(fg=THEME_COLORS['text_secondary'])
     
     def set_text(self, text):
         """Update the status text."""
-        self.label.configure(text=text)
+        if text == self._last_text:
+            return
+        self._last_text = text
+        self._text_var.set(text)
 
 
 class ResponsiveFrame(tk.Frame):
@@ -1,26 +1,76 @@
 #!/usr/bin/env python3
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import Optional, Dict, Any
+from tkinter import ttk, messagebox
+from typing import Dict
 import threading
 import time
+import queue
+from collections import OrderedDict
+from datetime import datetime
+from PIL import ImageTk
 
-from .components import ModernButton, StatusIndicator, ResponsiveFrame
+from .components import ModernButton, StatusIndicator
 from ..config.theme import (
-    THEME_COLORS, TITLE_FONT, HEADER_FONT, SUBTITLE_FONT, NORMAL_FONT, SMALL_FONT, 
-    COMPONENT_SPACING, BUTTON_STYLES
+    THEME_COLORS, TITLE_FONT, SUBTITLE_FONT, NORMAL_FONT, SMALL_FONT, COMPONENT_SPACING
+)
+from ..config.settings import (
+    LOOKUP_CACHE_SIZE, SHEETS_BATCH_SIZE, SHEETS_FLUSH_DELAY_MS,
+    NOTIFICATION_DURATION, NOTIFICATION_SIZE
 )
-from ..config.settings import DEFAULT_SPREADSHEET_ID, DEFAULT_SHEET_NAME
-from .tabs.scanner_tab import ScannerTab
 from .tabs.settings_tab import SettingsTab
 from .tabs.history_tab import HistoryTab
 from .tabs.logs_tab import LogsTab
 from src.config.paths import ICONS_DIR
+from ..utils.name_parser import extract_names_from_qr_data, clean_name
+from ..utils.scan_cache import ScanCache
 
 WINDOW_TITLE = "QR Scanner"
 WINDOW_SIZE = "800x800"
 
+# Leading characters of volunteer IDs used to reject unknown scans quickly
+ID_PREFIX_LENGTH = 8
+
+# Widget classes without their own copy binding, where Ctrl+C copies the last scan
+_LAST_SCAN_COPY_WIDGET_CLASSES = frozenset({
+    'Tk', 'Toplevel', 'Frame', 'Label', 'Button', 'Canvas',
+    'TFrame', 'TLabel', 'TButton', 'TNotebook',
+})
+
+# Sheets queue item asking the worker to upload scans left in the local cache
+_FLUSH_CACHED_SCANS = object()
+
+# ttk style configuration, applied once per process
+_STYLE_SPECS = (
+    ('TNotebook', {'background': THEME_COLORS['background']}),
+    ('TNotebook.Tab', {'padding': (10, 5), 'font': NORMAL_FONT}),
+    ('Treeview', {
+        'background': THEME_COLORS['surface'],
+        'foreground': THEME_COLORS['text'],
+        'fieldbackground': THEME_COLORS['surface'],
+        'font': NORMAL_FONT,
+    }),
+    ('Treeview.Heading', {
+        'background': THEME_COLORS['primary'],
+        'foreground': 'black',
+        'font': SUBTITLE_FONT,
+    }),
+)
+_STYLES_CONFIGURED = False
+
+
+def _configure_styles_once():
+    """Apply the shared ttk styles the first time a window is created."""
+    global _STYLES_CONFIGURED
+    if _STYLES_CONFIGURED:
+        return
+    
+    style = ttk.Style()
+    for style_name, options in _STYLE_SPECS:
+        style.configure(style_name, **options)
+    _STYLES_CONFIGURED = True
+
+
 class MainWindow:
     """Minimalist main window for the QR Scanner application."""
     
@@ -29,6 +79,61 @@ class MainWindow:
         self.app_manager = app_manager
         self.is_scanning = False
         
+        # Video frame coalescing: only the newest frame is rendered per idle pass
+        self._pending_frame = None
+        self._flush_scheduled = False
+        
+        # Status bar state. The StringVars exist before any widget so status
+        # updates from tabs under construction never need a guard.
+        self._status_var = tk.StringVar(value="Ready")
+        self._scan_count_var = tk.StringVar(value="Scans: 0")
+        self._last_scan_var = tk.StringVar()
+        self._last_scan_count = 0
+        self._status_pending = "Ready"
+        self._status_dirty = False
+        
+        # Persistent PhotoImage that new frames are pasted into
+        self._video_photo = None
+        self._video_size = (0, 0)
+        
+        # Master list index and fallback lookup cache, valid for one master list version
+        self._master_index: Dict[str, dict] = {}
+        self._master_prefixes: set = set()
+        self._lookup_cache: OrderedDict = OrderedDict()
+        self._lookup_cache_version = None
+        # Names parsed from QR data that is not in the master list
+        self._parsed_name_cache: OrderedDict = OrderedDict()
+        # History timestamp for the current second, shared by scans in a burst
+        self._ts_cache = (0, '')
+        self._last_scan_displayed = None
+        self._notification_hide_job = None
+        
+        # Scans are appended to Google Sheets in batches by a background worker,
+        # and kept in a local cache until an upload succeeds
+        self._scan_cache = ScanCache()
+        self._sheets_queue = queue.Queue()
+        self._sheets_stopping = False
+        self._sheets_worker = threading.Thread(target=self._sheets_worker_loop, daemon=True)
+        self._sheets_worker.start()
+        self._flush_cached_scans()
+        
+        # App manager callback dispatch table
+        self._callback_handlers = {
+            'scan': self._handle_scan_callback,
+            'video_frame': self._queue_video_frame,
+            'sheets_status': self._handle_sheets_status,
+            'credentials_status': self._handle_credentials_status,
+        }
+        
+        # Callbacks shared by all tabs
+        self._tab_callbacks = {
+            'update_status': self.update_status,
+            'update_scan_count': self._update_scan_count,
+            'invalidate_lookup_cache': self.invalidate_lookup_cache,
+            'master_list_loaded': self._on_master_list_loaded,
+            'sheets_connected': self._retry_cached_scans,
+        }
+        
         # Minimum window size
         self.min_window_size = (800, 600)
         
@@ -42,28 +147,11 @@ class MainWindow:
     
     def setup_styles(self):
         """Setup ttk styles for a clean, minimalist look."""
-        style = ttk.Style()
-        
-        # Configure notebook style
-        style.configure('TNotebook', background=THEME_COLORS['background'])
-        style.configure('TNotebook.Tab', padding=(10, 5), font=NORMAL_FONT)
-        
-        # Configure treeview styles
-        style.configure('Treeview', 
-                       background=THEME_COLORS['surface'],
-                       foreground=THEME_COLORS['text'],
-                       fieldbackground=THEME_COLORS['surface'],
-                       font=NORMAL_FONT)
-        
-        style.configure('Treeview.Heading', 
-                       background=THEME_COLORS['primary'],
-                       foreground='black',
-                       font=SUBTITLE_FONT)
+        _configure_styles_once()
     
     def setup_gui(self):
         """Setup the minimalist GUI layout."""
         self.root.title(WINDOW_TITLE)
-        self.root.geometry(WINDOW_SIZE)
         self.root.configure(bg=THEME_COLORS['background'])
 
         # Set favicon
@@ -71,11 +159,12 @@ class MainWindow:
         if favicon_path.exists():
             self.root.iconbitmap(str(favicon_path))
 
-        # Center the window on screen
-        self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() // 2) - (self.root.winfo_width() // 2)
-        y = (self.root.winfo_screenheight() // 2) - (self.root.winfo_height() // 2)
-        self.root.geometry(f"+{x}+{y}")
+        # Size and center the window in one geometry call; the size is known,
+        # so there is no need to force a layout pass to measure it
+        width, height = (int(v) for v in WINDOW_SIZE.split('x'))
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.geometry(f"{WINDOW_SIZE}+{x}+{y}")
 
         # Set minimum window size
         self.root.minsize(*self.min_window_size)
@@ -86,25 +175,53 @@ class MainWindow:
         
         # Main container
         self.main_container = tk.Frame(self.root, bg=THEME_COLORS['background'])
-        self.main_container.grid(row=0, column=0, sticky='nsew', 
-                                padx=COMPONENT_SPACING['content_padding'], 
-                                pady=COMPONENT_SPACING['content_padding'])
         self.main_container.grid_rowconfigure(1, weight=1)
         self.main_container.grid_columnconfigure(0, weight=1)
 
-        # Create sections
+        # Create sections, then map the container once so layout runs in one pass
         self._create_header_section(self.main_container)
         self._create_main_content(self.main_container)
         self._create_status_bar(self.main_container)
+        self.main_container.grid(row=0, column=0, sticky='nsew', 
+                                padx=COMPONENT_SPACING['content_padding'], 
+                                pady=COMPONENT_SPACING['content_padding'])
+
+        # Scan notifications reuse one window instead of creating one per scan
+        self._create_notification_window()
 
         # Set initial status
         self._set_initial_status()
+        
+        # Load the file dialog scripts while idle so the first dialog opens promptly
+        self.root.after(500, self._prewarm_dialogs)
+
+    def _prewarm_dialogs(self):
+        """Preload Tk's file dialog procedures ahead of first use."""
+        try:
+            self.root.tk.eval('auto_load tk_getOpenFile')
+            self.root.tk.eval('auto_load tk_getSaveFile')
+        except tk.TclError:
+            pass
 
     def setup_accessibility(self):
         """Setup basic accessibility features."""
         # Add keyboard shortcuts
-        self.root.bind('<Control-s>', lambda e: self._toggle_camera())
-        self.root.bind('<Control-c>', lambda e: self._copy_last_scan())
+        self.root.bind('<Control-s>', self._toggle_camera_event)
+        self.root.bind('<Control-c>', self._copy_last_scan)
+    
+    def _toggle_camera_event(self, event):
+        """Toggle the camera from a keyboard shortcut."""
+        self._toggle_camera()
+        return "break"
+    
+    def _copy_last_scan(self, event=None):
+        """Copy the most recent scan to the clipboard."""
+        # Only take over Ctrl+C where no widget has a copy of its own (entries, text, trees)
+        if event is not None and event.widget.winfo_class() not in _LAST_SCAN_COPY_WIDGET_CLASSES:
+            return None
+        if self._last_scan_displayed and self.app_manager.copy_to_clipboard(self._last_scan_displayed):
+            self.update_status("Last scan copied to clipboard")
+        return "break"
     
     def _create_header_section(self, parent):
         """Create a simplified header with just the title and essential status."""
@@ -123,46 +240,73 @@ class MainWindow:
     
     def _create_main_content(self, parent):
         """Create the main content area with simplified tabs."""
-        # Create notebook for tabs
+        bg_color = THEME_COLORS['background']
+        
+        # Create notebook for tabs. Each tab is populated before it is added,
+        # so the notebook lays out finished frames instead of growing ones.
         self.notebook = ttk.Notebook(parent)
-        self.notebook.grid(row=1, column=0, sticky='nsew')
         
         # Scanner tab (main functionality)
-        scanner_frame = tk.Frame(self.notebook, bg=THEME_COLORS['background'])
-        self.notebook.add(scanner_frame, text="Scanner")
+        scanner_frame = tk.Frame(self.notebook, bg=bg_color)
         self._create_scanner_tab(scanner_frame)
+        self.notebook.add(scanner_frame, text="Scanner")
         
         # Settings tab (essential configuration only)
-        settings_frame = tk.Frame(self.notebook, bg=THEME_COLORS['background'])
-        self.notebook.add(settings_frame, text="Settings")
+        settings_frame = tk.Frame(self.notebook, bg=bg_color)
         self._create_settings_tab(settings_frame)
+        self.notebook.add(settings_frame, text="Settings")
         
         # History tab (simplified)
-        history_frame = tk.Frame(self.notebook, bg=THEME_COLORS['background'])
-        self.notebook.add(history_frame, text="History")
+        history_frame = tk.Frame(self.notebook, bg=bg_color)
         self._create_history_tab(history_frame)
+        self.notebook.add(history_frame, text="History")
+        self._history_tab_id = str(history_frame)
 
-        # Logs tab
-        logs_frame = tk.Frame(self.notebook, bg=THEME_COLORS['background'])
+        # Logs tab (built the first time it is selected)
+        logs_frame = tk.Frame(self.notebook, bg=bg_color)
         self.notebook.add(logs_frame, text="Logs")
-        self._create_logs_tab(logs_frame)
+        self.logs_tab = None
+        self._tab_builders = {str(logs_frame): self._create_logs_tab}
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self.notebook.grid(row=1, column=0, sticky='nsew')
+    
+    def _on_tab_changed(self, event=None):
+        """Build a deferred tab the first time it is shown and track history visibility."""
+        tab_id = self.notebook.select()
+        builder = self._tab_builders.pop(tab_id, None)
+        if builder:
+            builder(self.notebook.nametowidget(tab_id))
+        
+        # History rows are only inserted into the tree while it can be seen
+        self.history_tab.set_visible(tab_id == self._history_tab_id)
     
     def _create_scanner_tab(self, parent):
         """Create a streamlined scanner tab with essential controls."""
+        bg_color = THEME_COLORS['background']
+        surface_color = THEME_COLORS['surface']
+        border_color = THEME_COLORS['border']
+        text_color = THEME_COLORS['text']
+        muted_color = THEME_COLORS['text_secondary']
+        
         # Main container
-        main_frame = tk.Frame(parent, bg=THEME_COLORS['background'])
+        main_frame = tk.Frame(parent, bg=bg_color)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Video frame (larger, more prominent)
-        self.video_frame = tk.Label(main_frame, text="Click 'Start' to begin scanning",
-                                   font=NORMAL_FONT, fg=THEME_COLORS['text_secondary'],
-                                   bg=THEME_COLORS['surface'], relief='solid', borderwidth=1,
-                                   highlightbackground=THEME_COLORS['border'],
-                                   highlightcolor=THEME_COLORS['border'])
-        self.video_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(20, 20))
+        # Video canvas (larger, more prominent). Frames and the placeholder text
+        # are canvas items, so a new frame only redraws the image region.
+        self.video_canvas = tk.Canvas(main_frame, bg=surface_color, relief='solid', borderwidth=1,
+                                     highlightthickness=0,
+                                     highlightbackground=border_color,
+                                     highlightcolor=border_color)
+        self.video_canvas.pack(fill=tk.BOTH, expand=True, padx=20, pady=(20, 20))
+        self._video_item = self.video_canvas.create_image(0, 0, anchor='center', state='hidden')
+        self._video_text_item = self.video_canvas.create_text(
+            0, 0, anchor='center', text="Click 'Start' to begin scanning",
+            font=NORMAL_FONT, fill=muted_color)
+        self.video_canvas.bind('<Configure>', self._center_video_items)
         
         # Bottom controls frame - start button and history textbox side by side
-        bottom_frame = tk.Frame(main_frame, bg=THEME_COLORS['background'])
+        bottom_frame = tk.Frame(main_frame, bg=bg_color)
         bottom_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
         # Configure grid weights for side-by-side layout
@@ -175,66 +319,77 @@ class MainWindow:
         self.start_button.grid(row=0, column=0, padx=(0, 10), sticky='w')
         
         # Last scan display (right side, takes remaining space)
-        self.last_scan_text = tk.Text(bottom_frame, height=1, wrap=tk.WORD,
-                                     font=NORMAL_FONT, bg=THEME_COLORS['surface'],
-                                     fg=THEME_COLORS['text'], relief='solid', borderwidth=1,
-                                     highlightbackground=THEME_COLORS['border'],
-                                     highlightcolor=THEME_COLORS['border'])
-        self.last_scan_text.grid(row=0, column=1, sticky='ew')
+        # A read-only one-line label; width=1 lets the grid size it rather than the text
+        self.last_scan_label = tk.Label(bottom_frame, textvariable=self._last_scan_var,
+                                       anchor='w', width=1, padx=4,
+                                       font=NORMAL_FONT, bg=surface_color,
+                                       fg=text_color, relief='solid', borderwidth=1,
+                                       highlightbackground=border_color,
+                                       highlightcolor=border_color)
+        self.last_scan_label.grid(row=0, column=1, sticky='ew')
+    
+    def _center_video_items(self, event):
+        """Keep the video image and placeholder text centred in the canvas."""
+        x, y = event.width // 2, event.height // 2
+        self.video_canvas.coords(self._video_item, x, y)
+        self.video_canvas.coords(self._video_text_item, x, y)
     
     def _create_settings_tab(self, parent):
         """Create a simplified settings tab with essential configuration."""
         # Use the existing settings tab but with simplified layout
-        callbacks = {
-            'update_status': self.update_status,
-            'update_scan_count': self._update_scan_count
-        }
-        self.settings_tab = SettingsTab(parent, self.app_manager, callbacks)
+        self.settings_tab = SettingsTab(parent, self.app_manager, self._tab_callbacks)
     
     def _create_history_tab(self, parent):
         """Create a simplified history tab."""
-        callbacks = {
-            'update_status': self.update_status,
-            'update_scan_count': self._update_scan_count
-        }
-        self.history_tab = HistoryTab(parent, self.app_manager, callbacks)
+        self.history_tab = HistoryTab(parent, self.app_manager, self._tab_callbacks)
     
     def _create_logs_tab(self, parent):
         """Create a simplified logs tab."""
-        callbacks = {
-            'update_status': self.update_status,
-            'update_scan_count': self._update_scan_count
-        }
-        self.logs_tab = LogsTab(parent, self.app_manager, callbacks)
+        self.logs_tab = LogsTab(parent, self.app_manager, self._tab_callbacks)
     
     def _create_status_bar(self, parent):
         """Create a minimal status bar."""
-        self.status_bar = tk.Frame(parent, bg=THEME_COLORS['surface'], 
+        surface_color = THEME_COLORS['surface']
+        border_color = THEME_COLORS['border']
+        muted_color = THEME_COLORS['text_secondary']
+        
+        self.status_bar = tk.Frame(parent, bg=surface_color, 
                                   relief='solid', borderwidth=1, height=25,
-                                  highlightbackground=THEME_COLORS['border'],
-                                  highlightcolor=THEME_COLORS['border'])
+                                  highlightbackground=border_color,
+                                  highlightcolor=border_color)
         self.status_bar.grid(row=2, column=0, sticky='ew', pady=(COMPONENT_SPACING['status_margin'], 0))
         self.status_bar.grid_propagate(False)
         
-        self.status_label = tk.Label(self.status_bar, text="Ready", 
-                                    font=SMALL_FONT, fg=THEME_COLORS['text_secondary'],
-                                    bg=THEME_COLORS['surface'])
+        # Labels are bound to StringVars so updates skip the configure() round-trip
+        self.status_label = tk.Label(self.status_bar, textvariable=self._status_var, 
+                                    font=SMALL_FONT, fg=muted_color,
+                                    bg=surface_color)
         self.status_label.pack(side=tk.LEFT, padx=10, pady=5)
+        
+        self.scan_count_label = tk.Label(self.status_bar, textvariable=self._scan_count_var,
+                                        font=SMALL_FONT, fg=muted_color,
+                                        bg=surface_color)
+        self.scan_count_label.pack(side=tk.RIGHT, padx=10, pady=5)
     
     def update_status(self, message):
         """Update the status bar message."""
-        if hasattr(self, 'status_label'):
-            self.status_label.configure(text=message)
-            self.root.update_idletasks()
+        # Coalesce bursts of status messages; only the last one is shown
+        self._status_pending = message
+        if not self._status_dirty:
+            self._status_dirty = True
+            self.root.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Show the most recent pending status message."""
+        self._status_dirty = False
+        self._status_var.set(self._status_pending)
     
     def _set_initial_status(self):
         """Set initial status."""
-        self.camera_status.set_status('neutral')
-        self.camera_status.set_text("Camera Ready")
+        self.camera_status.set_state('neutral', "Camera Ready")
         
         # Refresh settings tab configuration with loaded values
-        if hasattr(self, 'settings_tab'):
-            self.root.after(100, self.settings_tab.refresh_configuration)
+        self.root.after(100, self.settings_tab.refresh_configuration)
         
         # Auto-start camera after a short delay
         self.root.after(1000, self._auto_start_camera)
@@ -246,10 +401,36 @@ class MainWindow:
     
     def handle_app_callback(self, callback_type, data=None):
         """Handle callbacks from the application manager."""
-        if callback_type == 'scan':
-            self.process_scan(data['content'], data['type'])
-        elif callback_type == 'video_frame':
-            self.update_video_frame(data)
+        handler = self._callback_handlers.get(callback_type)
+        if handler:
+            handler(data)
+    
+    def _handle_scan_callback(self, data):
+        """Process a scan reported by the application manager."""
+        self.process_scan(data['content'], data['type'])
+    
+    def _handle_sheets_status(self, data):
+        """Reflect a Google Sheets status update in the settings tab."""
+        self.settings_tab.sheets_status.set_state(data['status'], data['text'])
+    
+    def _handle_credentials_status(self, data):
+        """Reflect a credentials status update in the settings tab."""
+        self.settings_tab.update_credentials_status(data['status'], data['message'])
+    
+    def _queue_video_frame(self, frame):
+        """Queue a video frame for rendering on the next idle pass."""
+        # Keep only the latest frame; intermediate frames are dropped
+        self._pending_frame = frame
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_video_frame)
+    
+    def _flush_video_frame(self):
+        """Render the most recent pending video frame."""
+        frame = self._pending_frame
+        self._pending_frame = None
+        self._flush_scheduled = False
+        self.update_video_frame(frame)
     
     def _toggle_camera(self):
         """Toggle camera on/off."""
@@ -263,8 +444,7 @@ class MainWindow:
         if self.app_manager.start_camera():
             self.is_scanning = True
             self.start_button.configure(text="Stop Camera", bg=THEME_COLORS['error'], fg='white')
-            self.camera_status.set_status('success')
-            self.camera_status.set_text("Camera Active")
+            self.camera_status.set_state('success', "Camera Active")
             self.update_status("Camera started")
         else:
             messagebox.showerror("Error", "Could not open camera")
@@ -275,91 +455,254 @@ class MainWindow:
         self.app_manager.stop_camera()
         self.is_scanning = False
         self.start_button.configure(text="Start Camera", bg=THEME_COLORS['primary'], fg='white')
-        self.camera_status.set_status('neutral')
-        self.camera_status.set_text("Camera Ready")
-        self.video_frame.config(text="Camera stopped", image="")
+        self.camera_status.set_state('neutral', "Camera Ready")
+        self.video_canvas.itemconfigure(self._video_item, image="", state='hidden')
+        self.video_canvas.itemconfigure(self._video_text_item, text="Camera stopped", state='normal')
+        self._video_photo = None
+        self._video_size = (0, 0)
         self.update_status("Camera stopped")
     
 
     
-    def update_video_frame(self, photo):
-        """Update the video frame with a new image."""
-        if photo and self.video_frame:
-            self.video_frame.config(image=photo, text="")
-            self.video_frame.image = photo
+    def update_video_frame(self, frame):
+        """Update the video frame with a new PIL image."""
+        if frame is None or not self.video_canvas:
+            return
+        
+        if frame.size != self._video_size:
+            # First frame or resolution change: allocate a new photo image
+            self._video_photo = ImageTk.PhotoImage(frame)
+            self._video_size = frame.size
+            self.video_canvas.itemconfigure(self._video_item, image=self._video_photo, state='normal')
+            self.video_canvas.itemconfigure(self._video_text_item, state='hidden')
+        else:
+            self._video_photo.paste(frame)
     
     def process_scan(self, data, barcode_type):
         """Process a new scan with enhanced user feedback."""
-        # Update last scan text
-        self.last_scan_text.delete(1.0, tk.END)
-        self.last_scan_text.insert(1.0, data)
+        # Update last scan display, skipping repeat reads of the same code
+        if data != self._last_scan_displayed:
+            self._last_scan_var.set(data)
+            self._last_scan_displayed = data
         
-        # Look up volunteer information
-        volunteer_info = self.app_manager.lookup_volunteer(data)
+        # Resolve the name from the master list, falling back to the QR data
+        first_name, last_name, source = self._resolve_name(data)
+        display_name = f"{first_name} {last_name}".rstrip()
         
-        if volunteer_info:
-            first_name = volunteer_info['first_name']
-            last_name = volunteer_info['last_name']
-            # Welcome message for found volunteers
-            welcome_message = f"Welcome, {first_name} {last_name}! ✅"
-            self.update_status(welcome_message)
+        # Each branch only picks the status message; the status bar is written once below
+        if source == 'master':
+            status = "✅ Found"
+            final_status = f"✅ {display_name} - Checked in"
             
             # Show a brief notification (optional - could be enhanced with a popup)
             self._show_welcome_notification(first_name, last_name)
             
-            # Add to Google Sheets only if user is found
-            if self.app_manager.add_scan_data(data, barcode_type):
-                self.update_status(f"✅ {first_name} {last_name} - Checked in successfully")
-            else:
-                self.update_status(f"❌ Failed to add {first_name} {last_name} to sheets")
+            # Queue for Google Sheets only if user is found
+            self._queue_scan_for_sheets(data, barcode_type)
         else:
-            # User not found message
-            not_found_message = f"User not found ❌ (ID: {data})"
-            self.update_status(not_found_message)
+            status = "❌ Not Found"
+            # Do not add to Google Sheets for users not found
+            final_status = "⚠️ User not in master list - not added to sheets"
             
             # Show a brief notification for not found users
             self._show_not_found_notification(data)
-            
-            # Do not add to Google Sheets for users not found
-            self.update_status(f"⚠️ User not in master list - not added to sheets")
+        
+        self.update_status(final_status)
         
         # Add to history
-        if hasattr(self, 'history_tab'):
-            # Use volunteer info if available, otherwise extract from QR data
-            if volunteer_info:
-                first_name = volunteer_info['first_name']
-                last_name = volunteer_info['last_name']
-                display_name = f"{first_name} {last_name}"
-                status = "✅ Found"
-            else:
+        self.history_tab.add_to_history(
+            self._now_fmt(),
+            data,
+            display_name,
+            status,
+            barcode_type
+        )
+    
+    def _now_fmt(self):
+        """Return the current time as HH:MM:SS, formatting it at most once per second."""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            lt = time.localtime(now)
+            self._ts_cache = (now, f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}")
+        return self._ts_cache[1]
+    
+    def _resolve_name(self, data):
+        """Resolve a scan to (first_name, last_name, source), where source is 'master' or 'qr'."""
+        volunteer_info = self._lookup_volunteer(data)
+        if volunteer_info:
+            return volunteer_info['first_name'], volunteer_info['last_name'], 'master'
+        
+        # Parsing only depends on the data, so results stay valid across master list reloads
+        cache = self._parsed_name_cache
+        names = cache.get(data)
+        if names is not None:
+            cache.move_to_end(data)
+        else:
+            try:
+                first_name, last_name = extract_names_from_qr_data(data)
+                names = (clean_name(first_name), clean_name(last_name))
+            except Exception:
+                names = (data, '')
+            cache[data] = names
+            if len(cache) > LOOKUP_CACHE_SIZE:
+                cache.popitem(last=False)
+        return names[0], names[1], 'qr'
+    
+    def _lookup_volunteer(self, volunteer_id):
+        """Look up a volunteer, reusing results until the master list reloads."""
+        self._sync_master_index()
+        
+        # A loaded index is authoritative; the prefix set rejects most unknown
+        # payloads (often long URLs or vCards) before the whole key is normalised
+        if self._master_index:
+            volunteer_id = str(volunteer_id)
+            if volunteer_id.lstrip()[:ID_PREFIX_LENGTH].rstrip().lower() not in self._master_prefixes:
+                return None
+            return self._master_index.get(volunteer_id.strip().lower())
+        
+        cache = self._lookup_cache
+        if volunteer_id in cache:
+            cache.move_to_end(volunteer_id)
+            return cache[volunteer_id]
+        
+        volunteer_info = self.app_manager.lookup_volunteer(volunteer_id)
+        cache[volunteer_id] = volunteer_info
+        if len(cache) > LOOKUP_CACHE_SIZE:
+            cache.popitem(last=False)
+        return volunteer_info
+    
+    def _sync_master_index(self):
+        """Pull the master list index and rebuild lookup state if the list was reloaded."""
+        version = self.app_manager.master_list_version
+        if self._lookup_cache_version != version:
+            self._lookup_cache.clear()
+            self._master_index = self.app_manager.get_master_index()
+            # Trailing spaces are dropped so a short ID still matches when the scan has padding after it
+            self._master_prefixes = {key[:ID_PREFIX_LENGTH].rstrip() for key in self._master_index}
+            self._lookup_cache_version = version
+    
+    def invalidate_lookup_cache(self):
+        """Drop cached volunteer lookups so the next scan rebuilds them."""
+        self._lookup_cache.clear()
+        self._lookup_cache_version = None
+    
+    def _queue_scan_for_sheets(self, data, barcode_type):
+        """Queue a scan for the next batched Google Sheets append."""
+        self._sheets_queue.put((data, barcode_type, datetime.now()))
+    
+    def _sheets_worker_loop(self):
+        """Run the sheets worker, closing the scan cache once it has finished with it."""
+        try:
+            self._send_queued_scans()
+        finally:
+            # Closed here rather than on the Tk thread so an in-flight upload can still mark its rows
+            self._scan_cache.close()
+    
+    def _send_queued_scans(self):
+        """Drain queued scans into batched Google Sheets appends off the Tk thread."""
+        flush_delay = SHEETS_FLUSH_DELAY_MS / 1000
+        while True:
+            scan = self._sheets_queue.get()
+            if scan is None:
+                return
+            if scan is _FLUSH_CACHED_SCANS:
+                self._upload_cached_scans()
+                continue
+            
+            # Gather scans until the batch is full or the flush delay expires
+            batch = [scan]
+            deadline = time.monotonic() + flush_delay
+            stopping = False
+            while len(batch) < SHEETS_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 try:
-                    first_name, last_name = extract_names_from_qr_data(data)
-                    first_name = clean_name(first_name)
-                    last_name = clean_name(last_name)
-                    display_name = f"{first_name} {last_name}"
-                except:
-                    display_name = data
-                status = "❌ Not Found"
+                    scan = self._sheets_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if scan is None:
+                    stopping = True
+                    break
+                if scan is not _FLUSH_CACHED_SCANS:
+                    batch.append(scan)
             
-            self.history_tab.add_to_history(
-                time.strftime('%H:%M:%S'),
-                data,
-                display_name,
-                status,
-                barcode_type
-            )
+            # Send earlier unsent scans (including previous sessions) along with this batch
+            if self._scan_cache.add(batch):
+                self._upload_cached_scans()
+            else:
+                recorded = self.app_manager.add_scan_batch(batch)
+                if recorded != len(batch):
+                    self._report_sheets_status(f"❌ Failed to add {len(batch) - (recorded or 0)} scan(s) to sheets")
+            if stopping:
+                return
+    
+    def _upload_cached_scans(self):
+        """Send every cached scan that has not been uploaded, one batch at a time."""
+        while True:
+            rows = self._scan_cache.pending(limit=SHEETS_BATCH_SIZE)
+            if not rows:
+                return
+            
+            recorded = self.app_manager.add_scan_batch([row[1:] for row in rows])
+            if recorded is None:
+                self._report_sheets_status(
+                    f"⚠️ Sheets unavailable - {self._scan_cache.pending_count()} scan(s) saved for retry")
+                return
+            
+            if recorded < len(rows):
+                self._report_sheets_status(f"❌ Failed to add {len(rows) - recorded} scan(s) to sheets")
+            if not self._scan_cache.mark_uploaded([row[0] for row in rows]):
+                return  # pending() would hand back the same rows forever
+            if self._sheets_stopping:
+                return  # Anything left stays cached for the next session
+    
+    def _report_sheets_status(self, message):
+        """Show a sheets worker status message, unless the window is closing."""
+        # The Tk thread may be blocked joining this worker, so no Tk calls once stopping
+        if not self._sheets_stopping:
+            self.root.after(0, self.update_status, message)
+    
+    def _flush_cached_scans(self):
+        """Ask the sheets worker to upload scans left in the cache by outages or earlier sessions."""
+        self._sheets_queue.put(_FLUSH_CACHED_SCANS)
+    
+    def _retry_cached_scans(self):
+        """Flush cached scans after a connect or master list load, once scans can be checked."""
+        if self.app_manager.get_master_list_data():
+            self._flush_cached_scans()
+    
+    def _on_master_list_loaded(self):
+        """Index a freshly loaded master list and retry cached scans against it."""
+        self._sync_master_index()
+        self._retry_cached_scans()
+    
+    def _stop_sheets_worker(self):
+        """Stop the sheets worker after it has sent every queued scan."""
+        self._sheets_stopping = True
+        self._sheets_queue.put(None)
+        self._sheets_worker.join(timeout=5.0)
     
     def _update_scan_count(self):
         """Update scan count display."""
-        if hasattr(self, 'history_tab'):
-            count = self.history_tab.get_history_count()
-            # Could add a scan count display if needed
+        count = self.history_tab.history_count
+        if count != self._last_scan_count:
+            self._last_scan_count = count
+            self._scan_count_var.set(f"Scans: {count}")
     
     def _on_closing(self):
         """Handle window closing event."""
         try:
             print("Application closing...")
             
+            # Stop tab background work so nothing calls back into the destroyed window
+            self.settings_tab.shutdown()
+            if self.logs_tab is not None:
+                self.logs_tab.shutdown()
+            
+            # Send any scans still waiting for the batched append
+            self._stop_sheets_worker()
+            
             # Shutdown the application properly
             if self.app_manager:
                 self.app_manager.shutdown()
@@ -389,82 +732,54 @@ class MainWindow:
                 import os
                 os._exit(0)
     
-    def _show_welcome_notification(self, first_name, last_name):
-        """Show a welcome notification for found volunteers."""
+    def _create_notification_window(self):
+        """Build the scan notification window once; it is shown and hidden per scan."""
+        width, height = (int(v) for v in NOTIFICATION_SIZE.split('x'))
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        
+        self._notification = tk.Toplevel(self.root)
+        self._notification.withdraw()
+        
+        # Remove window decorations (close, minimize, maximize buttons)
+        self._notification.overrideredirect(True)
+        self._notification.geometry(f"{NOTIFICATION_SIZE}+{x}+{y}")
+        self._notification.transient(self.root)
+        
+        self._notification_label = tk.Label(
+            self._notification,
+            font=('Segoe UI', 14, 'bold'),
+            fg='white',
+            wraplength=250
+        )
+        self._notification_label.pack(expand=True, fill=tk.BOTH)
+    
+    def _show_notification(self, text, bg):
+        """Show the notification window with the given message and colour."""
         try:
-            # Create a temporary notification window
-            notification = tk.Toplevel(self.root)
-            notification.title("Welcome!")
-            notification.geometry("300x150")
-            notification.configure(bg=THEME_COLORS['success'])
-            
-            # Remove window decorations (close, minimize, maximize buttons)
-            notification.overrideredirect(True)
-            
-            # Center the notification on screen
-            notification.update_idletasks()
-            x = (notification.winfo_screenwidth() // 2) - (300 // 2)
-            y = (notification.winfo_screenheight() // 2) - (150 // 2)
-            notification.geometry(f"300x150+{x}+{y}")
-            
-            # Make it transient and grab focus
-            notification.transient(self.root)
-            notification.grab_set()
-            
-            # Add welcome message
-            welcome_label = tk.Label(
-                notification, 
-                text=f"Welcome!\n{first_name} {last_name}",
-                font=('Segoe UI', 14, 'bold'),
-                fg='white',
-                bg=THEME_COLORS['success'],
-                wraplength=250
-            )
-            welcome_label.pack(expand=True)
-            
-            # Auto-close after 2 seconds
-            notification.after(2000, notification.destroy)
+            self._notification.configure(bg=bg)
+            self._notification_label.configure(text=text, bg=bg)
+            self._notification.deiconify()
+            self._notification.lift()
             
+            # Restart the auto-hide timer so each scan gets the full duration
+            if self._notification_hide_job:
+                self._notification.after_cancel(self._notification_hide_job)
+            self._notification_hide_job = self._notification.after(
+                int(NOTIFICATION_DURATION * 1000), self._hide_notification)
         except Exception as e:
             # Fallback to just logging if notification fails
-            print(f"Welcome notification error: {e}")
+            print(f"Notification error: {e}")
+    
+    def _hide_notification(self):
+        """Hide the notification window."""
+        self._notification_hide_job = None
+        self._notification.withdraw()
+    
+    def _show_welcome_notification(self, first_name, last_name):
+        """Show a welcome notification for found volunteers."""
+        self._show_notification(f"Welcome!\n{first_name} {last_name}", THEME_COLORS['success'])
     
     def _show_not_found_notification(self, volunteer_id):
         """Show a notification for users not found in master list."""
-        try:
-            # Create a temporary notification window
-            notification = tk.Toplevel(self.root)
-            notification.title("User Not Found")
-            notification.geometry("300x150")
-            notification.configure(bg=THEME_COLORS['error'])
-            
-            # Remove window decorations (close, minimize, maximize buttons)
-            notification.overrideredirect(True)
-            
-            # Center the notification on screen
-            notification.update_idletasks()
-            x = (notification.winfo_screenwidth() // 2) - (300 // 2)
-            y = (notification.winfo_screenheight() // 2) - (150 // 2)
-            notification.geometry(f"300x150+{x}+{y}")
-            
-            # Make it transient and grab focus
-            notification.transient(self.root)
-            notification.grab_set()
-            
-            # Add not found message
-            not_found_label = tk.Label(
-                notification, 
-                text=f"User Not Found\nID: {volunteer_id}",
-                font=('Segoe UI', 14, 'bold'),
-                fg='white',
-                bg=THEME_COLORS['error'],
-                wraplength=250
-            )
-            not_found_label.pack(expand=True)
-            
-            # Auto-close after 2 seconds
-            notification.after(2000, notification.destroy)
-            
-        except Exception as e:
-            # Fallback to just logging if notification fails
-            print(f"Not found notification error: {e}") 
\ No newline at end of file
+        self._show_notification(f"User Not Found\nID: {volunteer_id}", THEME_COLORS['error'])
@@ -2,14 +2,36 @@
 History tab component for the QR Scanner application.
 """
 
+import csv
+import sys
 import tkinter as tk
+from collections import deque
+from itertools import islice
+from dataclasses import dataclass
 from tkinter import ttk, filedialog, messagebox
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 from ...config.theme import THEME_COLORS, HEADER_FONT, NORMAL_FONT, COMPONENT_SPACING
+from ...config.settings import MAX_HISTORY_ITEMS, MAX_HISTORY_RECORDS, HISTORY_PAGE_SIZE
 from ..components import ModernButton
 
 
+@dataclass(frozen=True)
+class ScanRecord:
+    """Data class for a single row of scan history."""
+    __slots__ = ('timestamp', 'id_number', 'name', 'status', 'barcode_type')
+    
+    timestamp: str
+    id_number: str
+    name: str
+    status: str
+    barcode_type: str
+    
+    def as_row(self) -> Tuple[str, str, str, str, str]:
+        """Return the record as a tuple in display/export column order."""
+        return (self.timestamp, self.id_number, self.name, self.status, self.barcode_type)
+
+
 class HistoryTab:
     """Simplified history tab for scan history."""
     
@@ -17,26 +39,48 @@ class HistoryTab:
         self.parent = parent
         self.app_manager = app_manager
         self.callbacks = callbacks
+        # Resolved once; add_to_history runs for every scan
+        self._cb_status = callbacks.get('update_status')
+        self._cb_count = callbacks.get('update_scan_count')
         
-        self.scan_history = []
+        # Full history model; the tree only shows the newest MAX_HISTORY_ITEMS rows
+        self.scan_history: deque = deque(maxlen=MAX_HISTORY_RECORDS)
+        self._tree_items: deque = deque()
+        # Rendered record per tree item, so reads never go back through Tcl
+        self._records_by_iid: Dict[str, ScanRecord] = {}
+        # Rows waiting for the next idle pass, so bursts of scans insert together.
+        # While the tab is hidden they wait until it is shown; once more than a
+        # screenful is waiting the tree is marked stale and rebuilt on show.
+        self._pending_tree_rows = []
+        self._tree_flush_scheduled = False
+        self._tree_visible = False
+        self._tree_stale = False
+        self._older_rows_scheduled = False
+        # Scans this session, which keeps counting once the model starts dropping old rows
+        self.history_count = 0
         self.history_tree = None
         
-        self._create_history_interface()
+        # The interface is built the first time the tab is shown; until then
+        # scans are only recorded in the model
     
     def _create_history_interface(self):
         """Create a simplified history interface."""
+        bg_color = THEME_COLORS['background']
+        border_color = THEME_COLORS['border']
+        text_color = THEME_COLORS['text']
+        
         # Main container
-        main_frame = tk.Frame(self.parent, bg=THEME_COLORS['background'])
+        main_frame = tk.Frame(self.parent, bg=bg_color)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Title
         title_label = tk.Label(main_frame, text="Scan History", 
-                              font=HEADER_FONT, fg=THEME_COLORS['text'], 
-                              bg=THEME_COLORS['background'])
+                              font=HEADER_FONT, fg=text_color, 
+                              bg=bg_color)
         title_label.pack(anchor=tk.W, pady=(0, 15))
         
         # Controls
-        controls_frame = tk.Frame(main_frame, bg=THEME_COLORS['background'])
+        controls_frame = tk.Frame(main_frame, bg=bg_color)
         controls_frame.pack(fill=tk.X, pady=(0, 15))
         
         export_button = ModernButton(controls_frame, text="Export", 
@@ -50,10 +94,10 @@ class HistoryTab:
         clear_button.pack(side=tk.LEFT)
         
         # History treeview
-        tree_frame = tk.Frame(main_frame, bg=THEME_COLORS['background'], 
+        tree_frame = tk.Frame(main_frame, bg=bg_color, 
                              relief='solid', borderwidth=1,
-                             highlightbackground=THEME_COLORS['border'],
-                             highlightcolor=THEME_COLORS['border'])
+                             highlightbackground=border_color,
+                             highlightcolor=border_color)
         tree_frame.pack(fill=tk.BOTH, expand=True)
         
         # Create treeview
@@ -75,37 +119,124 @@ class HistoryTab:
         self.history_tree.column('Type', width=60)
         
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.history_tree.yview)
-        self.history_tree.configure(yscrollcommand=scrollbar.set)
+        self._scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.history_tree.yview)
+        self.history_tree.configure(yscrollcommand=self._on_tree_scroll)
         
         self.history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind double-click event
         self.history_tree.bind('<Double-1>', self._copy_from_history)
     
     def add_to_history(self, timestamp: str, id_number: str, name: str, status: str, barcode_type: str):
         """Add a new scan to the history."""
-        # Add to internal list
-        self.scan_history.append((timestamp, id_number, name, status, barcode_type))
+        # Add to internal list. Status and barcode type come from a handful of
+        # values, so interning lets every record share the same string objects.
+        record = ScanRecord(timestamp, id_number, name, sys.intern(status), sys.intern(barcode_type))
+        self.scan_history.append(record)
+        self.history_count += 1
         
-        # Add to treeview (newest first)
-        if self.history_tree:
-            self.history_tree.insert('', 0, values=(timestamp, id_number, name, status, barcode_type))
+        # Add to treeview on the next idle pass, or when the tab is next shown
+        if self.history_tree and not self._tree_stale:
+            self._pending_tree_rows.append(record)
+            if len(self._pending_tree_rows) > MAX_HISTORY_ITEMS:
+                self._pending_tree_rows.clear()
+                self._tree_stale = True
+        if self._tree_visible:
+            self._schedule_tree_flush()
         
         # Update scan count
-        if self.callbacks.get('update_scan_count'):
-            self.callbacks['update_scan_count']()
+        if self._cb_count:
+            self._cb_count()
+    
+    def set_visible(self, visible: bool):
+        """Tell the tab whether it is shown; rows are only inserted while it is."""
+        self._tree_visible = visible
+        if visible:
+            if self.history_tree is None:
+                self._create_history_interface()
+                self._tree_stale = bool(self.scan_history)
+            self._schedule_tree_flush()
+    
+    def _schedule_tree_flush(self):
+        """Schedule an idle pass to insert pending rows, if any are waiting."""
+        if (self._pending_tree_rows or self._tree_stale) and not self._tree_flush_scheduled:
+            self._tree_flush_scheduled = True
+            self.parent.after_idle(self._flush_tree_rows)
+    
+    def _flush_tree_rows(self):
+        """Insert pending rows into the treeview (newest first) in one pass."""
+        self._tree_flush_scheduled = False
+        tree = self.history_tree
+        tree_items = self._tree_items
+        records_by_iid = self._records_by_iid
+        
+        if self._tree_stale:
+            # Too much arrived while hidden; redraw the newest rows from the model
+            self._tree_stale = False
+            tree.delete(*tree_items)
+            tree_items.clear()
+            records_by_iid.clear()
+            self._pending_tree_rows = []
+            records = list(islice(reversed(self.scan_history), MAX_HISTORY_ITEMS))[::-1]
+        else:
+            records, self._pending_tree_rows = self._pending_tree_rows, []
+        
+        for record in records:
+            iid = tree.insert('', 0, values=record.as_row())
+            tree_items.append(iid)
+            records_by_iid[iid] = record
+        
+        # Drop the oldest rows beyond the display limit
+        self._release_oldest_rows()
+    
+    def _release_oldest_rows(self):
+        """Delete the oldest rendered rows beyond the display limit."""
+        excess = len(self._tree_items) - MAX_HISTORY_ITEMS
+        if excess > 0:
+            iids = [self._tree_items.popleft() for _ in range(excess)]
+            for iid in iids:
+                del self._records_by_iid[iid]
+            self.history_tree.delete(*iids)
+    
+    def _on_tree_scroll(self, first, last):
+        """Page older rows in at the bottom and release them again at the top."""
+        self._scrollbar.set(first, last)
+        if float(last) >= 1.0:
+            if not self._older_rows_scheduled:
+                self._older_rows_scheduled = True
+                self.parent.after_idle(self._render_older_rows)
+        elif float(first) <= 0.0:
+            self._release_oldest_rows()
+    
+    def _render_older_rows(self):
+        """Append the next page of older records from the model below the rendered rows."""
+        self._older_rows_scheduled = False
+        rendered = len(self._tree_items) + len(self._pending_tree_rows)
+        older = list(islice(reversed(self.scan_history), rendered, rendered + HISTORY_PAGE_SIZE))
+        if not older:
+            return
+        
+        tree = self.history_tree
+        records_by_iid = self._records_by_iid
+        for record in older:
+            iid = tree.insert('', 'end', values=record.as_row())
+            self._tree_items.appendleft(iid)
+            records_by_iid[iid] = record
     
     def clear_history(self):
         """Clear the scan history."""
         self.scan_history.clear()
+        self.history_count = 0
+        self._pending_tree_rows.clear()
+        self._tree_stale = False
         if self.history_tree:
-            for item in self.history_tree.get_children():
-                self.history_tree.delete(item)
+            self.history_tree.delete(*self.history_tree.get_children())
+        self._tree_items.clear()
+        self._records_by_iid.clear()
         
-        if self.callbacks.get('update_scan_count'):
-            self.callbacks['update_scan_count']()
+        if self._cb_count:
+            self._cb_count()
     
     def _copy_from_history(self, event):
         """Copy selected item from history to clipboard."""
@@ -113,12 +244,12 @@ class HistoryTab:
             return
             
         selection = self.history_tree.selection()
-        if selection:
-            item = self.history_tree.item(selection[0])
-            id_number = item['values'][1]  # ID is in column 1
+        record = self._records_by_iid.get(selection[0]) if selection else None
+        if record:
+            id_number = record.id_number
             if self.app_manager.copy_to_clipboard(id_number):
-                if self.callbacks.get('update_status'):
-                    self.callbacks['update_status']("ID copied to clipboard")
+                if self._cb_status:
+                    self._cb_status("ID copied to clipboard")
     
     def _export_history(self):
         """Export scan history to file."""
@@ -134,13 +265,15 @@ class HistoryTab:
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    f.write("Time,ID,Name,Status,Type\n")
-                    for timestamp, id_number, name, status, barcode_type in self.scan_history:
-                        f.write(f"{timestamp},{id_number},{name},{status},{barcode_type}\n")
+                # Tab-separated for .txt, standard CSV otherwise
+                dialect = 'excel-tab' if filename.lower().endswith('.txt') else 'excel'
+                with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                    writer = csv.writer(f, dialect=dialect)
+                    writer.writerow(('Time', 'ID', 'Name', 'Status', 'Type'))
+                    writer.writerows(record.as_row() for record in self.iter_history())
                 
-                if self.callbacks.get('update_status'):
-                    self.callbacks['update_status'](f"History exported to {filename}")
+                if self._cb_status:
+                    self._cb_status(f"History exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export: {str(e)}")
     
@@ -151,13 +284,17 @@ class HistoryTab:
         
         if messagebox.askyesno("Clear History", "Clear all scan history?"):
             self.clear_history()
-            if self.callbacks.get('update_status'):
-                self.callbacks['update_status']("History cleared")
+            if self._cb_status:
+                self._cb_status("History cleared")
     
     def get_history_count(self) -> int:
-        """Get the number of items in history."""
-        return len(self.scan_history)
+        """Get the number of scans recorded since the history was last cleared."""
+        return self.history_count
+    
+    def snapshot_history(self) -> List[ScanRecord]:
+        """Get an independent copy of the scan history, oldest first."""
+        return list(self.scan_history)
     
-    def get_history_data(self) -> List[Tuple]:
-        """Get the scan history data."""
-        return self.scan_history.copy() 
\ No newline at end of file
+    def iter_history(self) -> Iterator[ScanRecord]:
+        """Iterate over the scan history, oldest first, without copying it."""
+        return iter(self.scan_history) 
\ No newline at end of file
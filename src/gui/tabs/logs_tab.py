@@ -1,13 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import mmap
 import os
-from datetime import datetime, date
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from itertools import islice
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 from ...config.theme import THEME_COLORS, NORMAL_FONT, HEADER_FONT, SMALL_FONT, COMPONENT_SPACING
 from ...config.paths import LOGS_DIR
+from ...config.settings import LOG_PAGE_SIZE, LOG_MMAP_THRESHOLD
 from ...gui.components import ModernButton
 
+# Expected format: 2025-07-25 18:05:55,541 - src.utils.file_utils - INFO - Starting QR Scanner application
+LogEntry = namedtuple('LogEntry', 'timestamp level logger message')
+
+_LOG_LINE_RE = re.compile(r'\d{4}-\d{2}-\d{2} (\d{2}:\d{2}:\d{2}),\d+ - (.*?) - (.*?) - (.*)')
+
 
 class LogsTab:
     def __init__(self, parent: tk.Frame, app_manager, callbacks: dict):
@@ -19,43 +32,57 @@ class LogsTab:
         self.current_log_file = None
         self.log_entries = []
         self.filtered_entries = []
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._closing = False
+        self._load_generation = 0
+        self._log_signature = None
+        self._log_offset = 0
+        self._level_buckets = {}
+        self._entries_by_iid = {}
+        self._older_rows_scheduled = False
         
         self._create_logs_interface()
         self._load_todays_logs()
     
     def _create_logs_interface(self):
         """Create a minimalist logs interface."""
+        bg_color = THEME_COLORS['background']
+        surface_color = THEME_COLORS['surface']
+        border_color = THEME_COLORS['border']
+        text_color = THEME_COLORS['text']
+        muted_color = THEME_COLORS['text_secondary']
+        
         # Main container
-        main_frame = tk.Frame(self.parent, bg=THEME_COLORS['background'])
+        main_frame = tk.Frame(self.parent, bg=bg_color)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=COMPONENT_SPACING['card_padding_xxl'], 
                        pady=COMPONENT_SPACING['card_padding_xxl'])
         
         # Header
-        header_frame = tk.Frame(main_frame, bg=THEME_COLORS['background'])
+        header_frame = tk.Frame(main_frame, bg=bg_color)
         header_frame.pack(fill=tk.X, pady=(0, COMPONENT_SPACING['card_margin']))
         
         title_label = tk.Label(header_frame, text="Application Logs", 
-                              font=HEADER_FONT, fg=THEME_COLORS['text'], 
-                              bg=THEME_COLORS['background'])
+                              font=HEADER_FONT, fg=text_color, 
+                              bg=bg_color)
         title_label.pack(side=tk.LEFT)
         
         # Today's date indicator
         today = date.today().strftime("%B %d, %Y")
         date_label = tk.Label(header_frame, text=f"Today: {today}", 
-                             font=SMALL_FONT, fg=THEME_COLORS['text_secondary'], 
-                             bg=THEME_COLORS['background'])
+                             font=SMALL_FONT, fg=muted_color, 
+                             bg=bg_color)
         date_label.pack(side=tk.RIGHT)
         
         # Simple controls frame
-        controls_frame = tk.Frame(main_frame, bg=THEME_COLORS['background'])
+        controls_frame = tk.Frame(main_frame, bg=bg_color)
         controls_frame.pack(fill=tk.X, pady=(0, COMPONENT_SPACING['card_margin']))
         
         # Level filter (simplified)
-        filter_frame = tk.Frame(controls_frame, bg=THEME_COLORS['background'])
+        filter_frame = tk.Frame(controls_frame, bg=bg_color)
         filter_frame.pack(side=tk.LEFT)
         
         tk.Label(filter_frame, text="Show:", font=NORMAL_FONT, 
-                fg=THEME_COLORS['text'], bg=THEME_COLORS['background']).pack(side=tk.LEFT)
+                fg=text_color, bg=bg_color).pack(side=tk.LEFT)
         
         self.level_var = tk.StringVar(value="ALL")
         level_combo = ttk.Combobox(filter_frame, textvariable=self.level_var, 
@@ -65,7 +92,7 @@ class LogsTab:
         level_combo.bind('<<ComboboxSelected>>', self._apply_filter)
         
         # Action buttons (minimal)
-        button_frame = tk.Frame(controls_frame, bg=THEME_COLORS['background'])
+        button_frame = tk.Frame(controls_frame, bg=bg_color)
         button_frame.pack(side=tk.RIGHT)
         
         self.refresh_button = ModernButton(button_frame, text="Refresh", 
@@ -79,10 +106,10 @@ class LogsTab:
         self.clear_button.pack(side=tk.LEFT)
         
         # Log entries frame
-        entries_frame = tk.Frame(main_frame, bg=THEME_COLORS['surface'], 
+        entries_frame = tk.Frame(main_frame, bg=surface_color, 
                                 relief='solid', borderwidth=1,
-                                highlightbackground=THEME_COLORS['border'],
-                                highlightcolor=THEME_COLORS['border'])
+                                highlightbackground=border_color,
+                                highlightcolor=border_color)
         entries_frame.pack(fill=tk.BOTH, expand=True)
         
         # Create treeview for log entries (simplified columns)
@@ -99,97 +126,160 @@ class LogsTab:
         self.log_tree.column('level', width=80, anchor='center')
         self.log_tree.column('message', width=400, anchor='w')
         
+        # Configure tag colors
+        self.log_tree.tag_configure('debug', foreground='gray')
+        self.log_tree.tag_configure('info', foreground='black')
+        self.log_tree.tag_configure('warning', foreground='orange')
+        self.log_tree.tag_configure('error', foreground='red')
+        self.log_tree.tag_configure('critical', foreground='darkred')
+        
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(entries_frame, orient=tk.VERTICAL, command=self.log_tree.yview)
-        self.log_tree.configure(yscrollcommand=scrollbar.set)
+        self._scrollbar = ttk.Scrollbar(entries_frame, orient=tk.VERTICAL, command=self.log_tree.yview)
+        self.log_tree.configure(yscrollcommand=self._on_tree_scroll)
         
         self.log_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind double-click to copy
         self.log_tree.bind('<Double-1>', self._copy_selected_entry)
         
         # Status frame
-        status_frame = tk.Frame(main_frame, bg=THEME_COLORS['background'])
+        status_frame = tk.Frame(main_frame, bg=bg_color)
         status_frame.pack(fill=tk.X, pady=(8, 0))
         
         self.status_label = tk.Label(status_frame, text="Ready", 
-                                   font=SMALL_FONT, fg=THEME_COLORS['text_secondary'],
-                                   bg=THEME_COLORS['background'])
+                                   font=SMALL_FONT, fg=muted_color,
+                                   bg=bg_color)
         self.status_label.pack(side=tk.LEFT)
     
     def _load_todays_logs(self):
-        """Load content from today's log file."""
+        """Load content from today's log file in the background."""
+        today_str = date.today().strftime("%Y%m%d")  # Format: YYYYMMDD
+        log_path = LOGS_DIR / f"qr_scanner_{today_str}.log"
+        
         try:
-            today_str = date.today().strftime("%Y%m%d")  # Format: YYYYMMDD
-            log_path = LOGS_DIR / f"qr_scanner_{today_str}.log"
-            
-            if not log_path.exists():
-                self._update_status(f"No log file for today: qr_scanner_{today_str}.log")
-                return
-            
-            self.current_log_file = log_path.name
-            self.log_entries = []
-            with open(log_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    entry = self._parse_log_line(line)
-                    if entry:
-                        self.log_entries.append(entry)
-            
-            self._apply_filter()
-            self._update_status(f"Loaded {len(self.log_entries)} entries from {self.current_log_file}")
+            stat = log_path.stat()
+        except OSError:
+            self._update_status(f"No log file for today: qr_scanner_{today_str}.log")
+            return
+        
+        # Skip the read entirely when the file hasn't changed since the last load
+        signature = (log_path.name, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if signature == self._log_signature:
+            self._update_status(f"No new entries in {log_path.name}")
+            return
+        
+        # Only the new tail needs parsing when the same file has grown since the last load
+        tail = (self._log_signature is not None and signature[:2] == self._log_signature[:2]
+                and stat.st_size >= self._log_offset)
+        offset = self._log_offset if tail else 0
+        previous = self.log_entries[-1:] if tail else []
+        
+        self._update_status(f"Loading {log_path.name}...")
+        self._load_generation += 1
+        generation = self._load_generation
+        future = self._executor.submit(self._read_log_entries, log_path, offset, previous)
+        future.add_done_callback(
+            lambda f: self._post_to_tk(self._on_logs_loaded, generation, log_path, signature, tail, f))
+    
+    def _read_log_entries(self, log_path: Path, offset: int = 0, previous: List[LogEntry] = ()) -> Tuple[List[LogEntry], int]:
+        """Parse a log file from a byte offset; runs on the worker thread.
+        
+        Returns the parsed entries and the offset just past the last complete line.
+        A partly written last line is left for the next read.
+        """
+        with open(log_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size - offset < LOG_MMAP_THRESHOLD:
+                f.seek(offset)
+                data = f.read()
+                end = data.rfind(b'\n') + 1
+                lines = data[:end].decode('utf-8', errors='replace').splitlines()
+                return self._parse_log_lines(lines, previous), offset + end
             
+            # Large reads are scanned through the page cache instead of being decoded in one piece
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                mm.seek(offset)
+                lines = (line.decode('utf-8', errors='replace')
+                         for line in iter(mm.readline, b'') if line.endswith(b'\n'))
+                return self._parse_log_lines(lines, previous), mm.rfind(b'\n', 0) + 1
+    
+    def _parse_log_lines(self, lines, previous: List[LogEntry] = ()) -> List[LogEntry]:
+        """Parse log lines into entries, folding unprefixed lines into the previous entry."""
+        parse_line = self._parse_log_line
+        entries = list(previous)
+        for line in lines:
+            entry = parse_line(line)
+            if entry is not None:
+                entries.append(entry)
+            elif not line.strip():
+                continue
+            elif entries:
+                # Lines without a log prefix (e.g. tracebacks) continue the previous entry
+                previous_entry = entries[-1]
+                entries[-1] = previous_entry._replace(message=f"{previous_entry.message}\n{line.rstrip()}")
+            else:
+                entries.append(LogEntry('', 'INFO', '', line.strip()))
+        return entries
+    
+    def _post_to_tk(self, callback, *args):
+        """Hand a finished load back to the Tk thread unless the window is closing."""
+        if not self._closing:
+            self.parent.after(0, callback, *args)
+    
+    def shutdown(self):
+        """Stop background log loading so it cannot outlive the window."""
+        self._closing = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _on_logs_loaded(self, generation: int, log_path: Path, signature: tuple, tail: bool, future):
+        """Show parsed log entries once a background load finishes."""
+        if generation != self._load_generation:
+            return  # A newer load has been started since
+        
+        try:
+            entries, self._log_offset = future.result()
         except Exception as e:
             self._update_status(f"Error loading logs: {str(e)}")
+            return
+        
+        if tail:
+            # The previous last entry comes back first, with any continuation lines folded in
+            count = len(self.log_entries)
+            self.log_entries[-1:] = entries
+            message = f"Loaded {len(self.log_entries) - count} new entries from {log_path.name}"
+        else:
+            self.log_entries = entries
+            message = f"Loaded {len(self.log_entries)} entries from {log_path.name}"
+        
+        self.current_log_file = log_path.name
+        self._log_signature = signature
+        self._level_buckets.clear()
+        self._apply_filter()
+        self._update_status(message)
     
-    def _parse_log_line(self, line: str) -> dict:
-        """Parse a log line into structured data."""
-        try:
-            # Expected format: 2025-07-25 18:05:55,541 - src.utils.file_utils - INFO - Starting QR Scanner application
-            parts = line.strip().split(' - ', 3)
-            if len(parts) >= 4:
-                timestamp = parts[0]
-                logger = parts[1]
-                level = parts[2]
-                message = parts[3]
-                
-                # Extract time from timestamp
-                try:
-                    dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S,%f")
-                    time_str = dt.strftime("%H:%M:%S")
-                except:
-                    time_str = timestamp
-                
-                return {
-                    'timestamp': time_str,
-                    'level': level,
-                    'logger': logger,
-                    'message': message
-                }
-            else:
-                # Fallback for malformed lines
-                return {
-                    'timestamp': '',
-                    'level': 'INFO',
-                    'logger': '',
-                    'message': line.strip()
-                }
-        except Exception:
-            return {
-                'timestamp': '',
-                'level': 'INFO',
-                'logger': '',
-                'message': line.strip()
-            }
+    def _parse_log_line(self, line: str) -> Optional[LogEntry]:
+        """Parse a log line into a LogEntry, or None if it has no log prefix."""
+        match = _LOG_LINE_RE.match(line.strip())
+        if not match:
+            return None
+        
+        time_str, logger, level, message = match.groups()
+        # Levels and logger names repeat on every line, so share one string object each
+        return LogEntry(time_str, sys.intern(level), sys.intern(logger), message)
     
     def _apply_filter(self, event=None):
         """Apply current filter to log entries."""
         level_filter = self.level_var.get()
         
-        self.filtered_entries = []
-        for entry in self.log_entries:
-            if level_filter == "ALL" or entry['level'] == level_filter:
-                self.filtered_entries.append(entry)
+        if level_filter == "ALL":
+            self.filtered_entries = self.log_entries
+        else:
+            # Each level is scanned once per load; switching back to it is a dict lookup
+            bucket = self._level_buckets.get(level_filter)
+            if bucket is None:
+                bucket = [entry for entry in self.log_entries if entry.level == level_filter]
+                self._level_buckets[level_filter] = bucket
+            self.filtered_entries = bucket
         
         self._update_log_display()
         self._update_status(f"Showing {len(self.filtered_entries)} of {len(self.log_entries)} entries")
@@ -197,36 +287,42 @@ class LogsTab:
     def _update_log_display(self):
         """Update the log display with filtered entries."""
         # Clear existing items
-        for item in self.log_tree.get_children():
-            self.log_tree.delete(item)
+        self.log_tree.delete(*self.log_tree.get_children())
+        self._entries_by_iid.clear()
         
-        # Sort filtered entries by timestamp (newest first)
-        sorted_entries = sorted(self.filtered_entries, 
-                               key=lambda x: x['timestamp'], 
-                               reverse=True)
-        
-        # Add filtered entries (newest first)
-        for entry in sorted_entries:
+        # Entries are in file order, so the newest come last; the tree never holds more than one page
+        for entry in islice(reversed(self.filtered_entries), LOG_PAGE_SIZE):
             # Color code by level
-            tags = (entry['level'].lower(),)
-            
-            self.log_tree.insert('', 'end', values=(
-                entry['timestamp'],
-                entry['level'],
-                entry['message']
-            ), tags=tags)
-        
-        # Configure tag colors
-        self.log_tree.tag_configure('debug', foreground='gray')
-        self.log_tree.tag_configure('info', foreground='black')
-        self.log_tree.tag_configure('warning', foreground='orange')
-        self.log_tree.tag_configure('error', foreground='red')
-        self.log_tree.tag_configure('critical', foreground='darkred')
+            iid = self.log_tree.insert('', 'end', values=(entry.timestamp, entry.level, entry.message),
+                                       tags=(entry.level.lower(),))
+            self._entries_by_iid[iid] = entry
         
         # Scroll to top to show latest entries
-        if self.log_tree.get_children():
+        if self._entries_by_iid:
             self.log_tree.yview_moveto(0)
     
+    def _on_tree_scroll(self, first, last):
+        """Page older entries in at the bottom and release them again at the top."""
+        self._scrollbar.set(first, last)
+        if float(last) >= 1.0:
+            if not self._older_rows_scheduled:
+                self._older_rows_scheduled = True
+                self.parent.after_idle(self._render_older_rows)
+        elif float(first) <= 0.0 and len(self._entries_by_iid) > LOG_PAGE_SIZE:
+            iids = self.log_tree.get_children()[LOG_PAGE_SIZE:]
+            for iid in iids:
+                del self._entries_by_iid[iid]
+            self.log_tree.delete(*iids)
+    
+    def _render_older_rows(self):
+        """Append the next page of older filtered entries below the rendered rows."""
+        self._older_rows_scheduled = False
+        rendered = len(self._entries_by_iid)
+        for entry in islice(reversed(self.filtered_entries), rendered, rendered + LOG_PAGE_SIZE):
+            iid = self.log_tree.insert('', 'end', values=(entry.timestamp, entry.level, entry.message),
+                                       tags=(entry.level.lower(),))
+            self._entries_by_iid[iid] = entry
+    
     def _refresh_logs(self):
         """Refresh the logs display."""
         self._load_todays_logs()
@@ -239,10 +335,9 @@ class LogsTab:
     def _copy_selected_entry(self, event=None):
         """Copy selected log entry to clipboard."""
         selection = self.log_tree.selection()
-        if selection:
-            item = self.log_tree.item(selection[0])
-            values = item['values']
-            entry_text = f"{values[0]} - {values[1]} - {values[2]}"
+        entry = self._entries_by_iid.get(selection[0]) if selection else None
+        if entry:
+            entry_text = f"{entry.timestamp} - {entry.level} - {entry.message}"
             
             self.parent.clipboard_clear()
             self.parent.clipboard_append(entry_text)
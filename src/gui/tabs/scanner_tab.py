@@ -5,6 +5,7 @@ Scanner tab component for the QR Scanner application.
 import tkinter as tk
 from tkinter import ttk
 from typing import Optional, Callable
+from PIL import ImageTk
 
 from ..components import ModernButton
 from ...config.theme import (
@@ -36,39 +37,47 @@ class ScannerTab:
         
         # State
         self.is_scanning = False
+        self._video_photo: Optional[ImageTk.PhotoImage] = None
+        self._video_size = (0, 0)
         
         self._create_scanner_interface()
     
     def _create_scanner_interface(self):
         """Create the scanner interface."""
+        bg_color = THEME_COLORS['background']
+        surface_color = THEME_COLORS['surface']
+        border_color = THEME_COLORS['border']
+        text_color = THEME_COLORS['text']
+        muted_color = THEME_COLORS['text_secondary']
+        
         # Left panel - Camera and Controls
-        left_panel = tk.Frame(self.parent, bg=THEME_COLORS['background'])
+        left_panel = tk.Frame(self.parent, bg=bg_color)
         left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Camera section
-        camera_card = tk.Frame(left_panel, bg=THEME_COLORS['surface'], 
+        camera_card = tk.Frame(left_panel, bg=surface_color, 
                               relief='solid', borderwidth=1,
-                              highlightbackground=THEME_COLORS['border'],
-                              highlightcolor=THEME_COLORS['border'])
+                              highlightbackground=border_color,
+                              highlightcolor=border_color)
         camera_card.pack(fill=tk.BOTH, expand=True, pady=(0, COMPONENT_SPACING['card_margin']))
         
         camera_title = tk.Label(camera_card, text="Camera Feed", font=HEADER_FONT,
-                               fg=THEME_COLORS['text'], bg=THEME_COLORS['surface'])
+                               fg=text_color, bg=surface_color)
         camera_title.pack(pady=COMPONENT_SPACING['header_padding'])
         
         # Video frame
         self.video_frame = tk.Label(camera_card, text="Camera not started", 
-                                   font=NORMAL_FONT, bg=THEME_COLORS['surface'],
-                                   fg=THEME_COLORS['text_secondary'], 
+                                   font=NORMAL_FONT, bg=surface_color,
+                                   fg=muted_color, 
                                    relief='solid', borderwidth=1,
-                                   highlightbackground=THEME_COLORS['border'],
-                                   highlightcolor=THEME_COLORS['border'])
+                                   highlightbackground=border_color,
+                                   highlightcolor=border_color)
         self.video_frame.pack(padx=COMPONENT_SPACING['card_padding'], 
                              pady=(0, COMPONENT_SPACING['card_padding']), 
                              fill=tk.BOTH, expand=True)
         
         # Camera controls
-        control_frame = tk.Frame(camera_card, bg=THEME_COLORS['surface'])
+        control_frame = tk.Frame(camera_card, bg=surface_color)
         control_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                           pady=(0, COMPONENT_SPACING['card_padding']))
         
@@ -80,25 +89,25 @@ class ScannerTab:
         # Copy button removed
         
         # Right panel - Results
-        right_panel = tk.Frame(self.parent, bg=THEME_COLORS['background'])
+        right_panel = tk.Frame(self.parent, bg=bg_color)
         right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
         # Last scan section
-        last_scan_card = tk.Frame(right_panel, bg=THEME_COLORS['surface'], 
+        last_scan_card = tk.Frame(right_panel, bg=surface_color, 
                                  relief='solid', borderwidth=1,
-                                 highlightbackground=THEME_COLORS['border'],
-                                 highlightcolor=THEME_COLORS['border'])
+                                 highlightbackground=border_color,
+                                 highlightcolor=border_color)
         last_scan_card.pack(fill=tk.X, pady=(0, COMPONENT_SPACING['card_margin']))
         
         last_scan_title = tk.Label(last_scan_card, text="Last Scan", font=HEADER_FONT,
-                                  fg=THEME_COLORS['text'], bg=THEME_COLORS['surface'])
+                                  fg=text_color, bg=surface_color)
         last_scan_title.pack(pady=COMPONENT_SPACING['header_padding'])
         
         self.last_scan_text = tk.Text(last_scan_card, height=4, wrap=tk.WORD,
-                                     font=NORMAL_FONT, bg=THEME_COLORS['surface'],
-                                     fg=THEME_COLORS['text'], relief='solid', borderwidth=1,
-                                     highlightbackground=THEME_COLORS['border'],
-                                     highlightcolor=THEME_COLORS['border'])
+                                     font=NORMAL_FONT, bg=surface_color,
+                                     fg=text_color, relief='solid', borderwidth=1,
+                                     highlightbackground=border_color,
+                                     highlightcolor=border_color)
         self.last_scan_text.pack(padx=COMPONENT_SPACING['card_padding'], 
                                 pady=(0, COMPONENT_SPACING['card_padding']), fill=tk.X)
     
@@ -130,11 +139,17 @@ class ScannerTab:
     
 
     
-    def update_video_frame(self, photo):
-        """Update the video frame with a new image."""
-        if photo and self.video_frame:
-            self.video_frame.config(image=photo, text="")
-            self.video_frame.image = photo  # Keep a reference
+    def update_video_frame(self, frame):
+        """Update the video frame with a new PIL image."""
+        if frame is None or not self.video_frame:
+            return
+        
+        if frame.size != self._video_size:
+            self._video_photo = ImageTk.PhotoImage(frame)
+            self._video_size = frame.size
+            self.video_frame.config(image=self._video_photo, text="")
+        else:
+            self._video_photo.paste(frame)
     
     def process_scan(self, data: str, barcode_type: str):
         """Process a new scan using the centralized scan service."""
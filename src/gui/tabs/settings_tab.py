@@ -3,11 +3,12 @@ Settings tab component for the QR Scanner application.
 """
 
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox
 from typing import Dict, Any
 
 from ...config.theme import THEME_COLORS, HEADER_FONT, NORMAL_FONT, COMPONENT_SPACING, TITLE_FONT, SUBTITLE_FONT
-from ...config.settings import DEFAULT_SPREADSHEET_ID, DEFAULT_SHEET_NAME, DEFAULT_MASTER_LIST_SPREADSHEET_ID, DEFAULT_MASTER_LIST_SHEET_NAME
+from ...config.settings import DEFAULT_SPREADSHEET_ID, DEFAULT_SHEET_NAME, DEFAULT_MASTER_LIST_SPREADSHEET_ID, DEFAULT_MASTER_LIST_SHEET_NAME, CREDENTIALS_FILETYPES
 from ..components import ModernButton, StatusIndicator
 
 
@@ -19,20 +20,32 @@ class SettingsTab:
         self.app_manager = app_manager
         self.callbacks = callbacks
         
+        # Configuration entries, created by _create_field_group
+        self.spreadsheet_entry = None
+        self.sheet_name_entry = None
+        self.master_spreadsheet_entry = None
+        self.master_sheet_name_entry = None
+        
+        # Worker for Google Sheets calls so network latency never blocks the Tk loop
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._closing = False
+        
         self._create_settings_interface()
         # Delay initial status check to ensure GUI is fully initialized
         self.parent.after(100, self._check_initial_status)
     
     def _create_settings_interface(self):
         """Create a well-spaced and organized settings interface."""
+        bg_color = THEME_COLORS['background']
+        
         # Main container with scrollable content
-        main_container = tk.Frame(self.parent, bg=THEME_COLORS['background'])
+        main_container = tk.Frame(self.parent, bg=bg_color)
         main_container.pack(fill=tk.BOTH, expand=True)
         
         # Create a canvas for scrolling
-        canvas = tk.Canvas(main_container, bg=THEME_COLORS['background'], highlightthickness=0)
+        canvas = tk.Canvas(main_container, bg=bg_color, highlightthickness=0)
         scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=THEME_COLORS['background'])
+        scrollable_frame = tk.Frame(canvas, bg=bg_color)
         
         # Configure the canvas to expand with the frame
         def _update_scroll_region(event=None):
@@ -91,7 +104,7 @@ class SettingsTab:
         scrollbar.pack(side="right", fill="y")
         
         # Main content frame with same padding as scanner tab
-        main_frame = tk.Frame(scrollable_frame, bg=THEME_COLORS['background'])
+        main_frame = tk.Frame(scrollable_frame, bg=bg_color)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=COMPONENT_SPACING['card_padding_xxl'], 
                        pady=COMPONENT_SPACING['card_padding_xxl'])
         
@@ -109,33 +122,38 @@ class SettingsTab:
     
     def _create_google_sheets_section(self, parent):
         """Create the Google Sheets configuration section."""
+        surface_color = THEME_COLORS['surface']
+        border_color = THEME_COLORS['border']
+        text_color = THEME_COLORS['text']
+        muted_color = THEME_COLORS['text_secondary']
+        
         # Section container
-        section_frame = tk.Frame(parent, bg=THEME_COLORS['surface'], 
+        section_frame = tk.Frame(parent, bg=surface_color, 
                                 relief='solid', borderwidth=1,
-                                highlightbackground=THEME_COLORS['border'],
-                                highlightcolor=THEME_COLORS['border'])
+                                highlightbackground=border_color,
+                                highlightcolor=border_color)
         section_frame.pack(fill=tk.X, pady=(0, COMPONENT_SPACING['card_margin']))
         
         # Bind mouse wheel to this section
         self._bind_mousewheel_to_widget(section_frame)
         
         # Section header
-        header_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        header_frame = tk.Frame(section_frame, bg=surface_color)
         header_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                          pady=COMPONENT_SPACING['header_padding'])
         
         title_label = tk.Label(header_frame, text="Google Sheets Setup", 
-                              font=HEADER_FONT, fg=THEME_COLORS['text'], 
-                              bg=THEME_COLORS['surface'])
+                              font=HEADER_FONT, fg=text_color, 
+                              bg=surface_color)
         title_label.pack(anchor=tk.W)
         
         desc_label = tk.Label(header_frame, text="Configure your Google Sheets connection for storing scan data", 
-                             font=NORMAL_FONT, fg=THEME_COLORS['text_secondary'], 
-                             bg=THEME_COLORS['surface'])
+                             font=NORMAL_FONT, fg=muted_color, 
+                             bg=surface_color)
         desc_label.pack(anchor=tk.W, pady=(4, 0))
         
         # Credentials section
-        cred_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        cred_frame = tk.Frame(section_frame, bg=surface_color)
         cred_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                        pady=(0, COMPONENT_SPACING['card_padding']))
         
@@ -150,12 +168,12 @@ class SettingsTab:
         self.credentials_button.pack(anchor=tk.W, pady=(0, COMPONENT_SPACING['card_padding']))
         
         # Connection configuration section
-        conn_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        conn_frame = tk.Frame(section_frame, bg=surface_color)
         conn_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                        pady=(0, COMPONENT_SPACING['card_padding']))
         
         # Section divider
-        divider = tk.Frame(conn_frame, height=1, bg=THEME_COLORS['border'])
+        divider = tk.Frame(conn_frame, height=1, bg=border_color)
         divider.pack(fill=tk.X, pady=(0, COMPONENT_SPACING['card_padding']))
         
         # Spreadsheet configuration
@@ -170,7 +188,7 @@ class SettingsTab:
                                 self._toggle_sheet_name_edit, "sheet_name")
         
         # Connect button
-        button_frame = tk.Frame(conn_frame, bg=THEME_COLORS['surface'])
+        button_frame = tk.Frame(conn_frame, bg=surface_color)
         button_frame.pack(fill=tk.X, pady=(16, 0))
         
         self.connect_button = ModernButton(button_frame, text="Connect to Google Sheets", 
@@ -179,7 +197,7 @@ class SettingsTab:
         self.connect_button.pack(anchor=tk.W)
         
         # Connection status
-        status_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        status_frame = tk.Frame(section_frame, bg=surface_color)
         status_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                          pady=(0, COMPONENT_SPACING['card_padding']))
         
@@ -188,33 +206,38 @@ class SettingsTab:
     
     def _create_master_list_section(self, parent):
         """Create the Master List configuration section."""
+        surface_color = THEME_COLORS['surface']
+        border_color = THEME_COLORS['border']
+        text_color = THEME_COLORS['text']
+        muted_color = THEME_COLORS['text_secondary']
+        
         # Section container
-        section_frame = tk.Frame(parent, bg=THEME_COLORS['surface'], 
+        section_frame = tk.Frame(parent, bg=surface_color, 
                                 relief='solid', borderwidth=1,
-                                highlightbackground=THEME_COLORS['border'],
-                                highlightcolor=THEME_COLORS['border'])
+                                highlightbackground=border_color,
+                                highlightcolor=border_color)
         section_frame.pack(fill=tk.X, pady=(0, COMPONENT_SPACING['card_margin']))
         
         # Bind mouse wheel to this section
         self._bind_mousewheel_to_widget(section_frame)
         
         # Section header
-        header_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        header_frame = tk.Frame(section_frame, bg=surface_color)
         header_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                          pady=COMPONENT_SPACING['header_padding'])
         
         title_label = tk.Label(header_frame, text="Master List Configuration", 
-                              font=HEADER_FONT, fg=THEME_COLORS['text'], 
-                              bg=THEME_COLORS['surface'])
+                              font=HEADER_FONT, fg=text_color, 
+                              bg=surface_color)
         title_label.pack(anchor=tk.W)
         
         desc_label = tk.Label(header_frame, text="Configure the source for your Master List data", 
-                             font=NORMAL_FONT, fg=THEME_COLORS['text_secondary'], 
-                             bg=THEME_COLORS['surface'])
+                             font=NORMAL_FONT, fg=muted_color, 
+                             bg=surface_color)
         desc_label.pack(anchor=tk.W, pady=(4, 0))
         
         # Configuration fields
-        config_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        config_frame = tk.Frame(section_frame, bg=surface_color)
         config_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                          pady=(0, COMPONENT_SPACING['card_padding']))
         
@@ -233,28 +256,28 @@ class SettingsTab:
                                 self._toggle_master_sheet_name_edit, "master_sheet_name")
         
         # Controls section
-        controls_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        controls_frame = tk.Frame(section_frame, bg=surface_color)
         controls_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                            pady=(0, COMPONENT_SPACING['card_padding']))
         
         # Section divider
-        divider = tk.Frame(controls_frame, height=1, bg=THEME_COLORS['border'])
+        divider = tk.Frame(controls_frame, height=1, bg=border_color)
         divider.pack(fill=tk.X, pady=(0, 16))
         
         # Auto-load checkbox
-        checkbox_frame = tk.Frame(controls_frame, bg=THEME_COLORS['surface'])
+        checkbox_frame = tk.Frame(controls_frame, bg=surface_color)
         checkbox_frame.pack(fill=tk.X, pady=(0, 16))
         
         self.auto_load_var = tk.BooleanVar(value=True)
         auto_load_check = tk.Checkbutton(checkbox_frame, text="Auto-load Master List on startup", 
                                         variable=self.auto_load_var, 
                                         command=self._update_auto_load_setting,
-                                        font=NORMAL_FONT, bg=THEME_COLORS['surface'],
-                                        fg=THEME_COLORS['text'])
+                                        font=NORMAL_FONT, bg=surface_color,
+                                        fg=text_color)
         auto_load_check.pack(side=tk.LEFT)
         
         # Load button
-        button_frame = tk.Frame(controls_frame, bg=THEME_COLORS['surface'])
+        button_frame = tk.Frame(controls_frame, bg=surface_color)
         button_frame.pack(fill=tk.X)
         
         load_button = ModernButton(button_frame, text="Load Master List Now", 
@@ -263,7 +286,7 @@ class SettingsTab:
         load_button.pack(anchor=tk.W)
         
         # Status
-        status_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        status_frame = tk.Frame(section_frame, bg=surface_color)
         status_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                          pady=(0, COMPONENT_SPACING['card_padding']))
         
@@ -272,22 +295,26 @@ class SettingsTab:
     
     def _create_field_group(self, parent, label_text, default_value, toggle_command, field_name):
         """Create a field group with label, entry, and toggle button."""
+        bg_color = THEME_COLORS['background']
+        surface_color = THEME_COLORS['surface']
+        text_color = THEME_COLORS['text']
+        
         # Container frame
-        field_frame = tk.Frame(parent, bg=THEME_COLORS['surface'])
+        field_frame = tk.Frame(parent, bg=surface_color)
         field_frame.pack(fill=tk.X, pady=(0, COMPONENT_SPACING['card_padding']))
         
         # Label
         label = tk.Label(field_frame, text=label_text, font=NORMAL_FONT, 
-                        fg=THEME_COLORS['text'], bg=THEME_COLORS['surface'])
+                        fg=text_color, bg=surface_color)
         label.pack(anchor=tk.W, pady=(0, 4))
         
         # Entry and button frame
-        input_frame = tk.Frame(field_frame, bg=THEME_COLORS['surface'])
+        input_frame = tk.Frame(field_frame, bg=surface_color)
         input_frame.pack(fill=tk.X)
         
         # Entry field
         entry = tk.Entry(input_frame, font=NORMAL_FONT, state='readonly',
-                        bg=THEME_COLORS['background'], fg=THEME_COLORS['text'],
+                        bg=bg_color, fg=text_color,
                         relief='solid', borderwidth=1)
         entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 8))
         entry.insert(0, default_value)
@@ -316,33 +343,38 @@ class SettingsTab:
     
     def _create_application_preferences_section(self, parent):
         """Create the Application Preferences section."""
+        surface_color = THEME_COLORS['surface']
+        border_color = THEME_COLORS['border']
+        text_color = THEME_COLORS['text']
+        muted_color = THEME_COLORS['text_secondary']
+        
         # Section container
-        section_frame = tk.Frame(parent, bg=THEME_COLORS['surface'], 
+        section_frame = tk.Frame(parent, bg=surface_color, 
                                 relief='solid', borderwidth=1,
-                                highlightbackground=THEME_COLORS['border'],
-                                highlightcolor=THEME_COLORS['border'])
+                                highlightbackground=border_color,
+                                highlightcolor=border_color)
         section_frame.pack(fill=tk.X, pady=(0, COMPONENT_SPACING['card_margin']))
         
         # Bind mouse wheel to this section
         self._bind_mousewheel_to_widget(section_frame)
         
         # Section header
-        header_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        header_frame = tk.Frame(section_frame, bg=surface_color)
         header_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                          pady=COMPONENT_SPACING['header_padding'])
         
         title_label = tk.Label(header_frame, text="Application Preferences", 
-                              font=HEADER_FONT, fg=THEME_COLORS['text'], 
-                              bg=THEME_COLORS['surface'])
+                              font=HEADER_FONT, fg=text_color, 
+                              bg=surface_color)
         title_label.pack(anchor=tk.W)
         
         desc_label = tk.Label(header_frame, text="Configure application behavior and automation", 
-                             font=NORMAL_FONT, fg=THEME_COLORS['text_secondary'], 
-                             bg=THEME_COLORS['surface'])
+                             font=NORMAL_FONT, fg=muted_color, 
+                             bg=surface_color)
         desc_label.pack(anchor=tk.W, pady=(4, 0))
         
         # Preferences frame
-        prefs_frame = tk.Frame(section_frame, bg=THEME_COLORS['surface'])
+        prefs_frame = tk.Frame(section_frame, bg=surface_color)
         prefs_frame.pack(fill=tk.X, padx=COMPONENT_SPACING['card_padding'], 
                         pady=(0, COMPONENT_SPACING['card_padding']))
         
@@ -350,7 +382,7 @@ class SettingsTab:
         current_prefs = self.app_manager.config_manager.get_user_preferences()
         
         # Auto-connect to Google Sheets checkbox
-        auto_connect_frame = tk.Frame(prefs_frame, bg=THEME_COLORS['surface'])
+        auto_connect_frame = tk.Frame(prefs_frame, bg=surface_color)
         auto_connect_frame.pack(fill=tk.X, pady=(0, 12))
         
         self.auto_connect_var = tk.BooleanVar(value=current_prefs.get('auto_connect_to_sheets', True))
@@ -358,12 +390,12 @@ class SettingsTab:
                                            text="Auto-connect to Google Sheets on startup", 
                                            variable=self.auto_connect_var, 
                                            command=self._update_auto_connect_setting,
-                                           font=NORMAL_FONT, bg=THEME_COLORS['surface'],
-                                           fg=THEME_COLORS['text'])
+                                           font=NORMAL_FONT, bg=surface_color,
+                                           fg=text_color)
         auto_connect_check.pack(side=tk.LEFT)
         
         # Auto-load master list checkbox
-        auto_load_frame = tk.Frame(prefs_frame, bg=THEME_COLORS['surface'])
+        auto_load_frame = tk.Frame(prefs_frame, bg=surface_color)
         auto_load_frame.pack(fill=tk.X, pady=(0, 12))
         
         self.auto_load_master_var = tk.BooleanVar(value=current_prefs.get('auto_load_master_list', True))
@@ -371,12 +403,12 @@ class SettingsTab:
                                                text="Auto-load Master List on startup", 
                                                variable=self.auto_load_master_var, 
                                                command=self._update_auto_load_master_setting,
-                                               font=NORMAL_FONT, bg=THEME_COLORS['surface'],
-                                               fg=THEME_COLORS['text'])
+                                               font=NORMAL_FONT, bg=surface_color,
+                                               fg=text_color)
         auto_load_master_check.pack(side=tk.LEFT)
         
         # Clipboard integration checkbox
-        clipboard_frame = tk.Frame(prefs_frame, bg=THEME_COLORS['surface'])
+        clipboard_frame = tk.Frame(prefs_frame, bg=surface_color)
         clipboard_frame.pack(fill=tk.X, pady=(0, 12))
         
         self.clipboard_var = tk.BooleanVar(value=current_prefs.get('clipboard_integration', True))
@@ -384,12 +416,12 @@ class SettingsTab:
                                         text="Copy scanned data to clipboard", 
                                         variable=self.clipboard_var, 
                                         command=self._update_clipboard_setting,
-                                        font=NORMAL_FONT, bg=THEME_COLORS['surface'],
-                                        fg=THEME_COLORS['text'])
+                                        font=NORMAL_FONT, bg=surface_color,
+                                        fg=text_color)
         clipboard_check.pack(side=tk.LEFT)
         
         # Notifications checkbox
-        notifications_frame = tk.Frame(prefs_frame, bg=THEME_COLORS['surface'])
+        notifications_frame = tk.Frame(prefs_frame, bg=surface_color)
         notifications_frame.pack(fill=tk.X, pady=(0, 12))
         
         self.notifications_var = tk.BooleanVar(value=current_prefs.get('notifications_enabled', True))
@@ -397,8 +429,8 @@ class SettingsTab:
                                             text="Show notifications for scan events", 
                                             variable=self.notifications_var, 
                                             command=self._update_notifications_setting,
-                                            font=NORMAL_FONT, bg=THEME_COLORS['surface'],
-                                            fg=THEME_COLORS['text'])
+                                            font=NORMAL_FONT, bg=surface_color,
+                                            fg=text_color)
         notifications_check.pack(side=tk.LEFT)
     
     def _bind_mousewheel_to_widget(self, widget):
@@ -432,35 +464,36 @@ class SettingsTab:
         self._auto_setup_credentials()
         
         # Check credentials status after auto-setup
+        connecting = False
         try:
             if self.app_manager.check_credentials():
-                self.credentials_status.set_status('success')
-                self.credentials_status.set_text("Credentials OK")
+                self.credentials_status.set_state('success', "Credentials OK")
                 self.credentials_button.pack_forget()
                 
                 # Auto-connect to sheets if credentials are available
                 self._auto_connect_to_sheets()
+                connecting = True
             else:
-                self.credentials_status.set_status('error')
-                self.credentials_status.set_text("Credentials needed")
+                self.credentials_status.set_state('error', "Credentials needed")
         except Exception:
-            self.credentials_status.set_status('error')
-            self.credentials_status.set_text("Credentials needed")
+            self.credentials_status.set_state('error', "Credentials needed")
+        
+        # The auto-connect result updates the status and loads the master list
+        if connecting:
+            self.sheets_status.set_state('neutral', "Connecting...")
+            return
         
         # Check sheets connection
         try:
             if self.app_manager.is_sheets_connected():
-                self.sheets_status.set_status('success')
-                self.sheets_status.set_text("Connected")
+                self.sheets_status.set_state('success', "Connected")
                 
                 # Auto-load master list if connected
                 self._auto_load_master_list_data()
             else:
-                self.sheets_status.set_status('error')
-                self.sheets_status.set_text("Not connected")
+                self.sheets_status.set_state('error', "Not connected")
         except Exception:
-            self.sheets_status.set_status('error')
-            self.sheets_status.set_text("Not connected")
+            self.sheets_status.set_state('error', "Not connected")
     
     def refresh_configuration(self):
         """Refresh the configuration fields with current loaded values."""
@@ -470,7 +503,7 @@ class SettingsTab:
             
             if current_config:
                 # Update main spreadsheet fields
-                if hasattr(self, 'spreadsheet_entry'):
+                if self.spreadsheet_entry is not None:
                     current_value = self.spreadsheet_entry.get()
                     new_value = current_config.spreadsheet_id
                     if current_value != new_value:
@@ -479,7 +512,7 @@ class SettingsTab:
                         self.spreadsheet_entry.insert(0, new_value)
                         self.spreadsheet_entry.configure(state='readonly')
                 
-                if hasattr(self, 'sheet_name_entry'):
+                if self.sheet_name_entry is not None:
                     current_value = self.sheet_name_entry.get()
                     new_value = current_config.sheet_name
                     if current_value != new_value:
@@ -489,7 +522,7 @@ class SettingsTab:
                         self.sheet_name_entry.configure(state='readonly')
                 
                 # Update master list fields
-                if hasattr(self, 'master_spreadsheet_entry'):
+                if self.master_spreadsheet_entry is not None:
                     current_value = self.master_spreadsheet_entry.get()
                     new_value = current_config.master_list_spreadsheet_id
                     if current_value != new_value:
@@ -498,7 +531,7 @@ class SettingsTab:
                         self.master_spreadsheet_entry.insert(0, new_value)
                         self.master_spreadsheet_entry.configure(state='readonly')
                 
-                if hasattr(self, 'master_sheet_name_entry'):
+                if self.master_sheet_name_entry is not None:
                     current_value = self.master_sheet_name_entry.get()
                     new_value = current_config.master_list_sheet_name
                     if current_value != new_value:
@@ -507,6 +540,10 @@ class SettingsTab:
                         self.master_sheet_name_entry.insert(0, new_value)
                         self.master_sheet_name_entry.configure(state='readonly')
                 
+                # Cached lookups may refer to the previous master list
+                if self.callbacks.get('invalidate_lookup_cache'):
+                    self.callbacks['invalidate_lookup_cache']()
+                
                 if self.callbacks.get('update_status'):
                     self.callbacks['update_status']("Configuration refreshed")
         except Exception as e:
@@ -515,43 +552,38 @@ class SettingsTab:
     
     def _auto_connect_to_sheets(self):
         """Automatically connect to sheets using default settings."""
+        spreadsheet_id = self.spreadsheet_entry.get().strip()
+        sheet_name = self.sheet_name_entry.get().strip()
+        
+        if spreadsheet_id and sheet_name:
+            message = "Auto-connecting to Google Sheets..."
+        else:
+            # Use default values if fields are empty
+            spreadsheet_id = DEFAULT_SPREADSHEET_ID
+            sheet_name = DEFAULT_SHEET_NAME
+            message = "Auto-connecting with default settings..."
+        
+        if self.callbacks.get('update_status'):
+            self.callbacks['update_status'](message)
+        
+        future = self._executor.submit(self.app_manager.connect_to_sheets, spreadsheet_id, sheet_name)
+        future.add_done_callback(
+            lambda f: self._post_to_tk(self._on_auto_connect_to_sheets_done, f))
+    
+    def _on_auto_connect_to_sheets_done(self, future):
+        """Update the UI once an automatic Google Sheets connection attempt finishes."""
         try:
-            spreadsheet_id = self.spreadsheet_entry.get().strip()
-            sheet_name = self.sheet_name_entry.get().strip()
+            spreadsheet_title = future.result()
+            self.sheets_status.set_state('success', f"Connected to {spreadsheet_title}")
+            self._notify_sheets_connected()
             
-            if spreadsheet_id and sheet_name:
-                if self.callbacks.get('update_status'):
-                    self.callbacks['update_status']("Auto-connecting to Google Sheets...")
-                
-                spreadsheet_title = self.app_manager.connect_to_sheets(spreadsheet_id, sheet_name)
-                self.sheets_status.set_status('success')
-                self.sheets_status.set_text(f"Connected to {spreadsheet_title}")
-                
-                if self.callbacks.get('update_status'):
-                    self.callbacks['update_status'](f"Auto-connected to: {spreadsheet_title}")
-                
-                # Auto-load master list after successful connection
-                self._auto_load_master_list_data()
-            else:
-                # Use default values if fields are empty
-                default_spreadsheet_id = DEFAULT_SPREADSHEET_ID
-                default_sheet_name = DEFAULT_SHEET_NAME
-                
-                if self.callbacks.get('update_status'):
-                    self.callbacks['update_status']("Auto-connecting with default settings...")
-                
-                spreadsheet_title = self.app_manager.connect_to_sheets(default_spreadsheet_id, default_sheet_name)
-                self.sheets_status.set_status('success')
-                self.sheets_status.set_text(f"Connected to {spreadsheet_title}")
-                
-                if self.callbacks.get('update_status'):
-                    self.callbacks['update_status'](f"Auto-connected to: {spreadsheet_title}")
-                
-                # Auto-load master list after successful connection
-                self._auto_load_master_list_data()
+            if self.callbacks.get('update_status'):
+                self.callbacks['update_status'](f"Auto-connected to: {spreadsheet_title}")
+            
+            # Auto-load master list after successful connection
+            self._auto_load_master_list_data()
         except Exception as e:
-            self.sheets_status.set_status('error')
-            self.sheets_status.set_text("Auto-connect failed")
+            self.sheets_status.set_state('error', "Auto-connect failed")
             if self.callbacks.get('update_status'):
                 self.callbacks['update_status'](f"Auto-connect failed: {str(e)}")
     
@@ -565,8 +597,7 @@ class SettingsTab:
             if os.path.exists(credentials_path):
                 # Check if credentials are already set up
                 if self.app_manager.check_credentials():
-                    self.credentials_status.set_status('success')
-                    self.credentials_status.set_text("Credentials OK")
+                    self.credentials_status.set_state('success', "Credentials OK")
                     self.credentials_button.pack_forget()
                     if self.callbacks.get('update_status'):
                         self.callbacks['update_status']("Credentials already configured")
@@ -577,25 +608,21 @@ class SettingsTab:
                     self.callbacks['update_status']("Auto-setting up credentials...")
                 
                 if self.app_manager.setup_credentials(str(credentials_path)):
-                    self.credentials_status.set_status('success')
-                    self.credentials_status.set_text("Credentials OK")
+                    self.credentials_status.set_state('success', "Credentials OK")
                     self.credentials_button.pack_forget()
                     
                     if self.callbacks.get('update_status'):
                         self.callbacks['update_status']("Credentials auto-configured")
                 else:
-                    self.credentials_status.set_status('error')
-                    self.credentials_status.set_text("Auto-setup failed")
+                    self.credentials_status.set_state('error', "Auto-setup failed")
                     if self.callbacks.get('update_status'):
                         self.callbacks['update_status']("Failed to auto-configure credentials")
             else:
-                self.credentials_status.set_status('error')
-                self.credentials_status.set_text("No credentials.json found")
+                self.credentials_status.set_state('error', "No credentials.json found")
                 if self.callbacks.get('update_status'):
                     self.callbacks['update_status']("Please add credentials.json file")
         except Exception as e:
-            self.credentials_status.set_status('error')
-            self.credentials_status.set_text("Auto-setup failed")
+            self.credentials_status.set_state('error', "Auto-setup failed")
             if self.callbacks.get('update_status'):
                 self.callbacks['update_status'](f"Auto-setup failed: {str(e)}")
     
@@ -603,14 +630,13 @@ class SettingsTab:
         """Setup Google Sheets API credentials."""
         filename = filedialog.askopenfilename(
             title="Select credentials.json file",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=CREDENTIALS_FILETYPES
         )
         
         if filename:
             try:
                 if self.app_manager.setup_credentials(filename):
-                    self.credentials_status.set_status('success')
-                    self.credentials_status.set_text("Credentials OK")
+                    self.credentials_status.set_state('success', "Credentials OK")
                     self.credentials_button.pack_forget()
                     if self.callbacks.get('update_status'):
                         self.callbacks['update_status']("Credentials configured")
@@ -633,10 +659,16 @@ class SettingsTab:
         if self.callbacks.get('update_status'):
             self.callbacks['update_status']("Connecting to Google Sheets...")
         
+        future = self._executor.submit(self.app_manager.connect_to_sheets, spreadsheet_id, sheet_name)
+        future.add_done_callback(
+            lambda f: self._post_to_tk(self._on_connect_to_sheets_done, f))
+    
+    def _on_connect_to_sheets_done(self, future):
+        """Update the UI once a Google Sheets connection attempt finishes."""
         try:
-            spreadsheet_title = self.app_manager.connect_to_sheets(spreadsheet_id, sheet_name)
-            self.sheets_status.set_status('success')
-            self.sheets_status.set_text(f"Connected to {spreadsheet_title}")
+            spreadsheet_title = future.result()
+            self.sheets_status.set_state('success', f"Connected to {spreadsheet_title}")
+            self._notify_sheets_connected()
             
             if self.callbacks.get('update_status'):
                 self.callbacks['update_status'](f"Connected to: {spreadsheet_title}")
@@ -646,8 +678,7 @@ class SettingsTab:
                 self._auto_load_master_list_data()
                 
         except Exception as e:
-            self.sheets_status.set_status('error')
-            self.sheets_status.set_text(f"Connection failed: {str(e)}")
+            self.sheets_status.set_state('error', f"Connection failed: {str(e)}")
             if self.callbacks.get('update_status'):
                 self.callbacks['update_status'](f"Connection error: {str(e)}")
     
@@ -671,24 +702,54 @@ class SettingsTab:
         try:
             # Update the app_manager with the Master List configuration
             self.app_manager.update_master_list_config(master_spreadsheet_id, master_sheet_name)
-            
-            count = self.app_manager.load_master_list()
+        except Exception as e:
+            self.master_list_status.set_state('error', "Load failed")
+            if self.callbacks.get('update_status'):
+                self.callbacks['update_status'](f"Error loading master list: {str(e)}")
+            return
+        
+        future = self._executor.submit(self.app_manager.load_master_list)
+        future.add_done_callback(
+            lambda f: self._post_to_tk(self._on_master_list_done, f))
+    
+    def _on_master_list_done(self, future):
+        """Update the UI once a master list load finishes."""
+        try:
+            count = future.result()
+            self._notify_master_list_loaded()
             if count > 0:
-                self.master_list_status.set_status('success')
-                self.master_list_status.set_text(f"Loaded {count} records")
+                self.master_list_status.set_state('success', f"Loaded {count} records")
                 if self.callbacks.get('update_status'):
                     self.callbacks['update_status'](f"Master list loaded: {count} records")
             else:
-                self.master_list_status.set_status('error')
-                self.master_list_status.set_text("No data found")
+                self.master_list_status.set_state('error', "No data found")
                 if self.callbacks.get('update_status'):
                     self.callbacks['update_status']("No data found in master list")
         except Exception as e:
-            self.master_list_status.set_status('error')
-            self.master_list_status.set_text("Load failed")
+            self.master_list_status.set_state('error', "Load failed")
             if self.callbacks.get('update_status'):
                 self.callbacks['update_status'](f"Error loading master list: {str(e)}")
     
+    def _post_to_tk(self, callback, future):
+        """Hand a finished Sheets call back to the Tk thread unless the window is closing."""
+        if not self._closing:
+            self.parent.after(0, callback, future)
+    
+    def shutdown(self):
+        """Stop background Sheets work so it cannot outlive the window."""
+        self._closing = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _notify_sheets_connected(self):
+        """Let the main window retry scans cached while Google Sheets was unreachable."""
+        if self.callbacks.get('sheets_connected'):
+            self.callbacks['sheets_connected']()
+    
+    def _notify_master_list_loaded(self):
+        """Let the main window index the freshly loaded master list before the next scan."""
+        if self.callbacks.get('master_list_loaded'):
+            self.callbacks['master_list_loaded']()
+    
     def _update_auto_load_setting(self):
         """Update the auto-load setting."""
         enabled = "enabled" if self.auto_load_var.get() else "disabled"
@@ -747,28 +808,37 @@ class SettingsTab:
             # Update the app_manager with the Master List configuration
             if master_spreadsheet_id and master_sheet_name:
                 self.app_manager.update_master_list_config(master_spreadsheet_id, master_sheet_name)
-            
-            count = self.app_manager.load_master_list()
+        except Exception as e:
+            self.master_list_status.set_state('error', "Auto-load failed")
+            if self.callbacks.get('update_status'):
+                self.callbacks['update_status'](f"Auto-load failed: {str(e)}")
+            return
+        
+        future = self._executor.submit(self.app_manager.load_master_list)
+        future.add_done_callback(
+            lambda f: self._post_to_tk(self._on_auto_load_master_list_done, f))
+    
+    def _on_auto_load_master_list_done(self, future):
+        """Update the UI once an automatic master list load finishes."""
+        try:
+            count = future.result()
+            self._notify_master_list_loaded()
             if count > 0:
-                self.master_list_status.set_status('success')
-                self.master_list_status.set_text(f"Auto-loaded {count} records")
+                self.master_list_status.set_state('success', f"Auto-loaded {count} records")
                 if self.callbacks.get('update_status'):
                     self.callbacks['update_status'](f"Auto-loaded {count} records")
             else:
-                self.master_list_status.set_status('error')
-                self.master_list_status.set_text("No master list data")
+                self.master_list_status.set_state('error', "No master list data")
                 if self.callbacks.get('update_status'):
                     self.callbacks['update_status']("No data found in master list")
         except Exception as e:
-            self.master_list_status.set_status('error')
-            self.master_list_status.set_text("Auto-load failed")
+            self.master_list_status.set_state('error', "Auto-load failed")
             if self.callbacks.get('update_status'):
                 self.callbacks['update_status'](f"Auto-load failed: {str(e)}")
     
     def update_credentials_status(self, status: str, message: str):
         """Update the credentials status indicator."""
-        self.credentials_status.set_status(status)
-        self.credentials_status.set_text(message)
+        self.credentials_status.set_state(status, message)
         
         if status == 'error':
             self.credentials_button.pack(pady=(0, 15))
@@ -8,7 +8,7 @@ from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
 
 from ..utils.logger import LoggerMixin, get_logger
-from ..utils.name_parser import extract_names_from_qr_data, clean_name
+from ..utils.name_parser import extract_names_from_qr_data, clean_name, format_name_last_first
 from ..utils.validation import validate_scan_data
 from ..utils.exceptions import ScanError, ValidationError
 
@@ -165,7 +165,7 @@ class ScanService(LoggerMixin):
             self.log_info(f"Found volunteer in master list: {first_name} {last_name}")
         
         # Format name as "last name, first name"
-        formatted_name = f"{last_name}, {first_name}" if last_name and first_name else f"{first_name}{last_name}"
+        formatted_name = format_name_last_first(first_name, last_name)
         
         return volunteer_info, formatted_name, first_name, last_name, user_found
     
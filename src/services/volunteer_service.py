@@ -6,7 +6,7 @@ from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 
 from ..utils.logger import LoggerMixin, get_logger
-from ..utils.name_parser import extract_names_from_qr_data, clean_name
+from ..utils.name_parser import extract_names_from_qr_data, clean_name, format_name_last_first
 
 logger = get_logger(__name__)
 
@@ -126,7 +126,7 @@ class VolunteerService(LoggerMixin):
                 self.log_warning(f"Volunteer ID '{scan_data}' not found in master list, using extracted names: {first_name} {last_name}")
             
             # Format name as "last name, first name"
-            formatted_name = f"{last_name}, {first_name}" if last_name and first_name else f"{first_name}{last_name}"
+            formatted_name = format_name_last_first(first_name, last_name)
             self.log_debug(f"Final formatted name: '{formatted_name}'")
             
             return formatted_name, first_name, last_name
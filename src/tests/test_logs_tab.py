@@ -0,0 +1,154 @@
+"""
+Tests for incremental log loading in the Logs tab.
+"""
+
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import Future
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from ..gui.tabs import logs_tab
+from ..gui.tabs.logs_tab import LogsTab
+
+
+class _ImmediateExecutor:
+    """Executor stand-in that runs submitted work on the calling thread."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class TestLogsTabLoading(unittest.TestCase):
+    """Test cases for LogsTab reading today's log from a saved offset."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.log_path = self.temp_dir / f"qr_scanner_{date.today().strftime('%Y%m%d')}.log"
+        self.log_path.write_bytes(b'')
+
+        dir_patcher = patch.object(logs_tab, 'LOGS_DIR', self.temp_dir)
+        dir_patcher.start()
+        self.addCleanup(dir_patcher.stop)
+
+        # Build the tab without any widgets; only the loading state is exercised
+        self.tab = LogsTab.__new__(LogsTab)
+        self.tab.parent = MagicMock()
+        self.tab.parent.after.side_effect = lambda delay, callback, *args: callback(*args)
+        self.tab.log_entries = []
+        self.tab.current_log_file = None
+        self.tab._executor = _ImmediateExecutor()
+        self.tab._closing = False
+        self.tab._load_generation = 0
+        self.tab._log_signature = None
+        self.tab._log_offset = 0
+        self.tab._level_buckets = {}
+        self.tab._apply_filter = MagicMock()
+        self.tab._update_status = MagicMock()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _append(self, text):
+        """Append raw text to the log file."""
+        with open(self.log_path, 'ab') as f:
+            f.write(text.encode('utf-8'))
+
+    def _line(self, second, level, message):
+        """Format a log line the way the application logger writes it."""
+        return f"2025-07-25 18:05:{second:02d},541 - src.main - {level} - {message}\n"
+
+    def _messages(self):
+        """Get the messages of the loaded entries."""
+        return [entry.message for entry in self.tab.log_entries]
+
+    def test_tail_read_after_append(self):
+        """Test that a refresh only parses lines appended since the last load."""
+        self._append(self._line(1, 'INFO', 'first') + self._line(2, 'WARNING', 'second'))
+        self.tab._load_todays_logs()
+
+        self.assertEqual(self._messages(), ['first', 'second'])
+        self.assertEqual(self.tab._log_offset, self.log_path.stat().st_size)
+
+        offset = self.tab._log_offset
+        self._append(self._line(3, 'ERROR', 'third'))
+        with patch.object(self.tab, '_read_log_entries', wraps=self.tab._read_log_entries) as read:
+            self.tab._load_todays_logs()
+
+        self.assertEqual(read.call_args.args[1], offset)
+        self.assertEqual(self._messages(), ['first', 'second', 'third'])
+        self.assertEqual(self.tab.log_entries[-1].level, 'ERROR')
+        self.assertEqual(self.tab._log_offset, self.log_path.stat().st_size)
+
+    def test_partial_line_waits_for_next_refresh(self):
+        """Test that a partly written last line is only shown once it is complete."""
+        self._append(self._line(1, 'INFO', 'first') + "2025-07-25 18:05:02,541 - src.main - INFO - sec")
+        self.tab._load_todays_logs()
+
+        self.assertEqual(self._messages(), ['first'])
+        self.assertEqual(self.tab._log_offset, len(self._line(1, 'INFO', 'first')))
+
+        self._append("ond\n")
+        self.tab._load_todays_logs()
+
+        self.assertEqual(self._messages(), ['first', 'second'])
+
+    def test_partial_line_waits_for_next_refresh_mmap(self):
+        """Test that large reads through mmap also leave a partly written last line."""
+        with patch.object(logs_tab, 'LOG_MMAP_THRESHOLD', 0):
+            self.test_partial_line_waits_for_next_refresh()
+
+    def test_traceback_folds_into_previous_entry(self):
+        """Test that a traceback appended after a refresh continues the last entry."""
+        self._append(self._line(1, 'INFO', 'first') + self._line(2, 'ERROR', 'Scan failed'))
+        self.tab._load_todays_logs()
+
+        self._append("Traceback (most recent call last):\n"
+                     "  File \"main.py\", line 1, in <module>\n"
+                     "ValueError: bad scan\n")
+        self.tab._load_todays_logs()
+
+        self.assertEqual(len(self.tab.log_entries), 2)
+        self.assertEqual(self.tab.log_entries[-1].message,
+                         "Scan failed\n"
+                         "Traceback (most recent call last):\n"
+                         "  File \"main.py\", line 1, in <module>\n"
+                         "ValueError: bad scan")
+
+    def test_truncated_file_is_reread(self):
+        """Test that a file truncated below the saved offset is read from the start."""
+        self._append(self._line(1, 'INFO', 'first') + self._line(2, 'INFO', 'second'))
+        self.tab._load_todays_logs()
+
+        with open(self.log_path, 'wb') as f:
+            f.write(self._line(3, 'INFO', 'new').encode('utf-8'))
+        with patch.object(self.tab, '_read_log_entries', wraps=self.tab._read_log_entries) as read:
+            self.tab._load_todays_logs()
+
+        self.assertEqual(read.call_args.args[1], 0)
+        self.assertEqual(self._messages(), ['new'])
+        self.assertEqual(self.tab._log_offset, self.log_path.stat().st_size)
+
+    def test_unchanged_file_is_not_reread(self):
+        """Test that a refresh with no new data skips reading the file."""
+        self._append(self._line(1, 'INFO', 'first'))
+        self.tab._load_todays_logs()
+
+        with patch.object(self.tab, '_read_log_entries') as read:
+            self.tab._load_todays_logs()
+
+        read.assert_not_called()
+        self.assertEqual(self._messages(), ['first'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,11 @@
 Tests for refactored services and utilities.
 """
 
+import sqlite3
+import tempfile
 import unittest
+from contextlib import closing
+from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 from typing import Dict, Any
@@ -11,6 +15,7 @@ from ..services.scan_service import ScanService, ScanResult
 from ..services.sheets_service import GoogleSheetsService, SheetConfig, ScanData
 from ..services.volunteer_service import VolunteerService
 from ..utils.common_utils import CallbackManager, StateManager, RetryManager
+from ..utils.scan_cache import ScanCache
 from ..config.config_manager import ConfigManager, ApplicationConfig
 from src.config.settings import DEFAULT_MASTER_LIST_SHEET_NAME
 
@@ -416,5 +421,95 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(config.spreadsheet_id, '1PjW2-qgjWs5123qkzVyOBc-OKs2Ygk1143zkl_CymwQ')  # Default value
 
 
+
+class TestScanCache(unittest.TestCase):
+    """Test cases for the ScanCache class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / 'scan_cache.db'
+        self.cache = ScanCache(self.db_path)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.cache.close()
+        self.temp_dir.cleanup()
+    
+    def test_add_and_pending(self):
+        """Test that added scans are pending, oldest first."""
+        first = datetime(2025, 7, 25, 9, 0, 0)
+        second = datetime(2025, 7, 25, 9, 0, 5)
+        
+        self.assertTrue(self.cache.add([('12345', 'QR_CODE', first), ('67890', 'CODE128', second)]))
+        
+        pending = self.cache.pending()
+        self.assertEqual([row[1:] for row in pending],
+                         [('12345', 'QR_CODE', first), ('67890', 'CODE128', second)])
+        self.assertEqual(self.cache.pending_count(), 2)
+    
+    def test_pending_limit(self):
+        """Test that pending returns at most the requested number of scans."""
+        scanned_at = datetime(2025, 7, 25, 9, 0, 0)
+        self.cache.add([(str(i), 'QR_CODE', scanned_at) for i in range(5)])
+        
+        pending = self.cache.pending(limit=2)
+        
+        self.assertEqual([row[1] for row in pending], ['0', '1'])
+        self.assertEqual(self.cache.pending_count(), 5)
+    
+    def test_mark_uploaded(self):
+        """Test that uploaded scans are no longer pending."""
+        scanned_at = datetime(2025, 7, 25, 9, 0, 0)
+        self.cache.add([('12345', 'QR_CODE', scanned_at), ('67890', 'QR_CODE', scanned_at)])
+        
+        first_id = self.cache.pending()[0][0]
+        self.cache.mark_uploaded([first_id])
+        
+        pending = self.cache.pending()
+        self.assertEqual([row[1] for row in pending], ['67890'])
+        self.assertEqual(self.cache.pending_count(), 1)
+    
+    def test_mark_uploaded_reports_failure(self):
+        """Test that mark_uploaded returns False when the scans could not be flagged."""
+        scanned_at = datetime(2025, 7, 25, 9, 0, 0)
+        self.cache.add([('12345', 'QR_CODE', scanned_at)])
+        row_ids = [row[0] for row in self.cache.pending()]
+        
+        self.assertTrue(self.cache.mark_uploaded([]))
+        self.cache.close()
+        self.assertFalse(self.cache.mark_uploaded(row_ids))
+        
+        self.cache = ScanCache(self.db_path)
+        self.assertTrue(self.cache.mark_uploaded(row_ids))
+        self.assertEqual(self.cache.pending(), [])
+    
+    def test_uploaded_scans_are_removed(self):
+        """Test that uploaded scans do not stay in the database."""
+        scanned_at = datetime(2025, 7, 25, 9, 0, 0)
+        self.cache.add([('12345', 'QR_CODE', scanned_at), ('67890', 'QR_CODE', scanned_at)])
+        self.cache.mark_uploaded([self.cache.pending()[0][0]])
+        self.cache.close()
+        
+        with closing(sqlite3.connect(str(self.db_path))) as conn, conn:
+            self.assertEqual(conn.execute("SELECT data FROM scans").fetchall(), [('67890',)])
+            # Rows flagged as uploaded by older versions are purged on open
+            conn.execute("UPDATE scans SET uploaded = 1")
+        
+        self.cache = ScanCache(self.db_path)
+        with closing(sqlite3.connect(str(self.db_path))) as conn, conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM scans").fetchone()[0], 0)
+    
+    def test_pending_survives_reopen(self):
+        """Test that unsent scans are still pending after the cache is reopened."""
+        scanned_at = datetime(2025, 7, 25, 9, 0, 0)
+        self.cache.add([('12345', 'QR_CODE', scanned_at)])
+        self.cache.close()
+        
+        self.cache = ScanCache(self.db_path)
+        
+        self.assertEqual([row[1:] for row in self.cache.pending()], [('12345', 'QR_CODE', scanned_at)])
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
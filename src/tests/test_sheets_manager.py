@@ -0,0 +1,119 @@
+"""
+Tests for the Google Sheets manager.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+from datetime import datetime
+
+from ..core.sheets_manager import GoogleSheetsManager
+
+
+class TestAddScanBatch(unittest.TestCase):
+    """Test cases for GoogleSheetsManager.add_scan_batch."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = GoogleSheetsManager()
+        self.manager.sheets_service = MagicMock()
+        self.manager.spreadsheet_id = 'spreadsheet_id'
+        self.manager.sheet_name = 'Attendance Log'
+        self.manager.master_list_headers = ['ID Number', 'First Name', 'Last Name']
+        self.manager.master_list_data = [
+            ['V001', 'Ada', 'Lovelace'],
+            ['V002', 'Alan', 'Turing'],
+            ['V003', 'Grace', 'Hopper'],
+        ]
+        self.manager._build_master_index()
+
+        # Scan sheet already holds a header row and a row for V002
+        self.values_api = self.manager.sheets_service.spreadsheets.return_value.values.return_value
+        self.values_api.get.return_value.execute.return_value = {
+            'values': [['ID Number'], ['V002']]
+        }
+
+        self.scanned_at = datetime(2025, 7, 25, 9, 30, 15)
+
+    def _appended_ids(self):
+        """Get the IDs sent in the single append request."""
+        self.values_api.append.assert_called_once()
+        body = self.values_api.append.call_args.kwargs['body']
+        return [row[0] for row in body['values']]
+
+    def test_not_connected_returns_none(self):
+        """Test that a batch is left for retry when not connected."""
+        self.manager.sheets_service = None
+
+        result = self.manager.add_scan_batch([('V001', 'QR_CODE', self.scanned_at)])
+
+        self.assertIsNone(result)
+
+    def test_master_list_not_loaded_returns_none(self):
+        """Test that a batch is left for retry when the master list is not loaded."""
+        self.manager.master_list_data = []
+
+        result = self.manager.add_scan_batch([('V001', 'QR_CODE', self.scanned_at)])
+
+        self.assertIsNone(result)
+        self.values_api.append.assert_not_called()
+
+    def test_appends_new_scans_in_one_request(self):
+        """Test that new scans are sent with a single append."""
+        result = self.manager.add_scan_batch([
+            ('V001', 'QR_CODE', self.scanned_at),
+            ('V003', 'QR_CODE', self.scanned_at),
+        ])
+
+        self.assertEqual(result, 2)
+        self.assertEqual(self._appended_ids(), ['V001', 'V003'])
+        body = self.values_api.append.call_args.kwargs['body']
+        self.assertEqual(body['values'][0], ['V001', '2025-07-25', '09:30:15 AM', 'Present'])
+
+    def test_dedupes_existing_and_in_batch_ids(self):
+        """Test that IDs already in the sheet or earlier in the batch are counted but not appended."""
+        result = self.manager.add_scan_batch([
+            ('V001', 'QR_CODE', self.scanned_at),
+            ('V002', 'QR_CODE', self.scanned_at),
+            (' V001 ', 'QR_CODE', self.scanned_at),
+        ])
+
+        self.assertEqual(result, 3)
+        self.assertEqual(self._appended_ids(), ['V001'])
+
+    def test_skips_unknown_ids(self):
+        """Test that IDs missing from the master list are neither counted nor appended."""
+        result = self.manager.add_scan_batch([
+            ('UNKNOWN', 'QR_CODE', self.scanned_at),
+            ('V003', 'QR_CODE', self.scanned_at),
+        ])
+
+        self.assertEqual(result, 1)
+        self.assertEqual(self._appended_ids(), ['V003'])
+
+    def test_no_append_when_nothing_new(self):
+        """Test that no append request is made when every scan already has a row."""
+        result = self.manager.add_scan_batch([('V002', 'QR_CODE', self.scanned_at)])
+
+        self.assertEqual(result, 1)
+        self.values_api.append.assert_not_called()
+
+    def test_api_error_returns_none(self):
+        """Test that a failed append leaves the batch for retry."""
+        self.values_api.append.return_value.execute.side_effect = Exception("Network error")
+
+        result = self.manager.add_scan_batch([('V001', 'QR_CODE', self.scanned_at)])
+
+        self.assertIsNone(result)
+
+    def test_existing_ids_read_error_returns_none(self):
+        """Test that failing to read existing IDs leaves the batch for retry."""
+        self.values_api.get.return_value.execute.side_effect = Exception("Network error")
+
+        result = self.manager.add_scan_batch([('V001', 'QR_CODE', self.scanned_at)])
+
+        self.assertIsNone(result)
+        self.values_api.append.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -199,7 +199,7 @@ class FileManager:
             # Get fieldnames from first item
             fieldnames = list(data[0].keys())
             
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(data)
@@ -77,4 +77,8 @@ def format_name_for_display(first_name: str, last_name: str) -> str:
     elif last_name:
         return last_name
     else:
-        return "Unknown" 
\ No newline at end of file
+        return "Unknown" 
+
+
+def format_name_last_first(first_name: str, last_name: str) -> str:
+    return ", ".join(part for part in (last_name, first_name) if part)
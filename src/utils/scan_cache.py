@@ -0,0 +1,116 @@
+"""
+Local SQLite cache of scans waiting to be uploaded to Google Sheets.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .logger import get_logger
+from ..config.paths import SCAN_CACHE_DB, ensure_directories
+
+logger = get_logger(__name__)
+
+
+class ScanCache:
+    """Durable record of scans so uploads survive network drops and restarts."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        ensure_directories()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path or SCAN_CACHE_DB), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scans ("
+            "id INTEGER PRIMARY KEY, "
+            "scanned_at TEXT NOT NULL, "
+            "data TEXT NOT NULL, "
+            "barcode_type TEXT, "
+            "uploaded INTEGER NOT NULL DEFAULT 0)"
+        )
+        # Uploaded scans are deleted as they are confirmed; drop any flagged by older versions
+        self._conn.execute("DELETE FROM scans WHERE uploaded = 1")
+        self._conn.commit()
+
+    def add(self, scans: List[Tuple[str, str, datetime]]) -> bool:
+        """
+        Record scans as not yet uploaded.
+
+        Args:
+            scans: List of (data, barcode_type, scanned_at) tuples
+
+        Returns:
+            True if the scans were written, False otherwise
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT INTO scans (scanned_at, data, barcode_type) VALUES (?, ?, ?)",
+                    [(scanned_at.isoformat(), data, barcode_type) for data, barcode_type, scanned_at in scans]
+                )
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error caching scans: {str(e)}")
+            return False
+
+    def pending(self, limit: Optional[int] = None) -> List[Tuple[int, str, str, datetime]]:
+        """
+        Get scans that have not been uploaded yet, oldest first.
+
+        Args:
+            limit: Maximum number of scans to return, or None for all of them
+
+        Returns:
+            List of (row_id, data, barcode_type, scanned_at) tuples
+        """
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, data, barcode_type, scanned_at FROM scans WHERE uploaded = 0 ORDER BY id LIMIT ?",
+                    (-1 if limit is None else limit,)
+                ).fetchall()
+            return [(row_id, data, barcode_type, datetime.fromisoformat(scanned_at))
+                    for row_id, data, barcode_type, scanned_at in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Error reading cached scans: {str(e)}")
+            return []
+
+    def pending_count(self) -> int:
+        """Get the number of scans that have not been uploaded yet."""
+        try:
+            with self._lock:
+                return self._conn.execute("SELECT COUNT(*) FROM scans WHERE uploaded = 0").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"Error counting cached scans: {str(e)}")
+            return 0
+
+    def mark_uploaded(self, row_ids: List[int]) -> bool:
+        """
+        Remove uploaded scans from the cache so it only holds unsent scans.
+
+        Args:
+            row_ids: Row IDs returned by pending()
+
+        Returns:
+            True if the scans were removed, False otherwise
+        """
+        if not row_ids:
+            return True
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "DELETE FROM scans WHERE id = ?",
+                    [(row_id,) for row_id in row_ids]
+                )
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error updating cached scans: {str(e)}")
+            return False
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
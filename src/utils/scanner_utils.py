@@ -18,7 +18,6 @@ def show_auto_notification(root, message):
     notification.configure(bg='#2c3e50')
     
     notification.transient(root)
-    notification.grab_set()
     
     notification.lift()
     notification.attributes('-topmost', True)
@@ -57,7 +56,8 @@ def copy_to_clipboard(root, text):
     try:
         root.clipboard_clear()
         root.clipboard_append(text)
-        root.update()
         print(f"Copied to clipboard: {text}")
+        return True
     except Exception as e:
-        print(f"Error copying to clipboard: {e}") 
\ No newline at end of file
+        print(f"Error copying to clipboard: {e}")
+        return False 
\ No newline at end of file